@@ -0,0 +1,350 @@
+# =============================================================================
+# benchmark_gather.py
+#
+# This script times the hot paths of the gather package: hymn number lookups,
+# title searches, keyify, importing the package, and loading the YAML
+# catalogs. It uses only the standard library and needs no network access.
+#
+# Each benchmark is run in loops long enough to time reliably (see
+# timeit.Timer.autorange), several times over; the fastest and median time
+# per call are reported. Import times are measured in fresh interpreters.
+#
+# Results can be written as JSON and compared against an earlier run:
+#
+#     python benchmark_gather.py --output before.json
+#     (change something)
+#     python benchmark_gather.py --output after.json --compare before.json
+#
+# =============================================================================
+"""
+Benchmark lookups, search, keyify and YAML loading in the gather package.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+# Benchmark the package in this checkout, not an installed copy
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+import gather
+from gather import loader
+
+
+def call_benchmarks():
+    """Get the benchmarks of single calls, by name.
+
+    Returns:
+        dict: Benchmark name -> function taking no arguments
+    """
+    titles = list(gather.hymns)
+    long_title = max(titles, key=len)
+    return {
+        'get_hymn_number/exact': lambda: gather.get_hymn_number('Amazing Grace'),
+        'get_hymn_number/folded': lambda: gather.get_hymn_number('ave maria (chant)'),
+        'get_hymn_number/miss': lambda: gather.get_hymn_number('Not A Hymn Title'),
+        'search_hymns/hit': lambda: gather.search_hymns('grace'),
+        'search_hymns/miss': lambda: gather.search_hymns('xylophone'),
+        'search_hymns/short': lambda: gather.search_hymns('a'),
+        'search_hymns/long': lambda: gather.search_hymns(long_title),
+        'find_hymn/typo': lambda: gather.find_hymn('Shepherd Me O Gd'),
+        'find_hymn/distance_4': lambda: gather.find_hymn('Shepherd Me O God', max_distance=4),
+        'find_hymn/miss': lambda: gather.find_hymn('Not A Hymn Title'),
+        'keyify/ascii': lambda: gather.keyify('A Hymn of Glory Let Us Sing!'),
+        'keyify/accented': lambda: gather.keyify('Adéste Fidéles / O Come, All Ye Faithful'),
+        'keyify_many/all_titles': lambda: gather.keyify_many(titles),
+    }
+
+
+def yaml_benchmarks(paths=None, compare=True):
+    """Get the benchmarks of parsing each YAML catalog, by name.
+
+    Files are parsed with the package's loader (see gather.loader.yaml_loader)
+    and, for comparison, with PyYAML's pure-Python SafeLoader.
+
+    Args:
+        paths: YAML files to parse; defaults to the package's catalogs
+        compare: Whether to also parse with SafeLoader
+    """
+    import yaml
+
+    def parse(path, loader_class):
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=loader_class)
+
+    if paths is None:
+        paths = [os.path.join(loader.DATA_DIR, file_name)
+                 for file_name in loader.CATALOG_FILES.values()]
+    benchmarks = {}
+    for path in paths:
+        file_name = os.path.basename(path)
+        benchmarks[f'load_yaml/{file_name}'] = (
+            lambda path=path: loader.load_yaml(path))
+        if compare:
+            benchmarks[f'load_yaml/{file_name}/SafeLoader'] = (
+                lambda path=path: parse(path, yaml.SafeLoader))
+    return benchmarks
+
+
+def time_call(function, repeat):
+    """Time a function.
+
+    Returns:
+        dict: Fastest and median seconds per call, and calls per timing
+    """
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    times = [total / loops for total in timer.repeat(repeat, loops)]
+    return {'min': min(times), 'median': statistics.median(times),
+            'loops': loops}
+
+
+def time_subprocess(code, repeat):
+    """Time code in fresh interpreters; the code prints seconds taken.
+
+    Returns:
+        dict: Fastest and median seconds, one interpreter per run
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True)
+        times.append(float(output.stdout))
+    return {'min': min(times), 'median': statistics.median(times), 'loops': 1}
+
+
+# Code run in a fresh interpreter; each prints the seconds taken
+SUBPROCESS_BENCHMARKS = {
+    'import_gather': (
+        "import time; t = time.perf_counter(); import gather; "
+        "print(time.perf_counter() - t)"),
+    'first_lookup': (
+        "import time; t = time.perf_counter(); import gather; "
+        "gather.get_hymn_number('Amazing Grace'); "
+        "print(time.perf_counter() - t)"),
+    'first_search': (
+        "import time; t = time.perf_counter(); import gather; "
+        "gather.search_hymns('grace'); print(time.perf_counter() - t)"),
+}
+
+
+def environment():
+    """Describe the environment results were measured in."""
+    import yaml
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                cwd=REPO_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'pyyaml': yaml.__version__,
+        'yaml_loader': loader.yaml_loader().__name__,
+        'snapshot': os.path.exists(os.path.join(REPO_DIR, 'catalog.snapshot')),
+        'commit': commit,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def use_synthetic_hymnal(size, directory):
+    """Swap the package's hymns table for a synthetic one.
+
+    See generate_synthetic_catalog.py. The table's gather.yml form is
+    written to the directory for the YAML benchmarks.
+
+    Returns:
+        str: Path of the synthetic YAML catalog
+    """
+    import generate_synthetic_catalog as synthetic
+    from gather import data
+    model = synthetic.TitleModel.from_gather()
+    hymns = synthetic.generate_hymns(size, model=model)
+    path = os.path.join(directory, f'synthetic-{size}.yml')
+    synthetic.write_catalog(
+        synthetic.catalog_entries(hymns, url_share=model.url_share), path)
+    data._snapshot, data._snapshot_read = None, True
+    data._hymns = hymns
+    data._indexes.clear()
+    return path
+
+
+def run(repeat=5, pattern=None, synthetic=None):
+    """Run the benchmarks.
+
+    Args:
+        repeat: Number of timings of each benchmark
+        pattern: Only run benchmarks whose name contains this
+        synthetic: Number of titles of a synthetic hymnal to run the lookup
+            and YAML benchmarks against, instead of the real catalogs;
+            import times are then not measured
+
+    Returns:
+        dict: Environment and results, as written by --output
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        yaml_paths = None
+        if synthetic is not None:
+            yaml_paths = [use_synthetic_hymnal(synthetic, directory)]
+        # Build the indexes first so lookups are timed in their steady state
+        start = time.perf_counter()
+        for function in call_benchmarks().values():
+            function()
+        elapsed = time.perf_counter() - start
+        results = {'build_indexes': {'min': elapsed, 'median': elapsed,
+                                     'loops': 1}}
+        report('build_indexes', results['build_indexes'])
+        benchmarks = dict(call_benchmarks(),
+                          **yaml_benchmarks(yaml_paths, synthetic is None))
+        for name, function in benchmarks.items():
+            if pattern is None or pattern in name:
+                results[name] = time_call(function, repeat)
+                report(name, results[name])
+    if synthetic is None:
+        for name, code in SUBPROCESS_BENCHMARKS.items():
+            if pattern is None or pattern in name:
+                results[name] = time_subprocess(code, repeat)
+                report(name, results[name])
+    return {'environment': dict(environment(), synthetic=synthetic),
+            'results': results}
+
+
+def reference_distance(a, b):
+    """Get the edit distance between two strings by dynamic programming."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def reference_find_hymn(title, max_distance):
+    """Get find_hymn's result by comparing the title with every hymn.
+
+    Distances come from gather.index.levenshtein, which check() compares
+    with reference_distance separately, so this checks the filtering.
+    """
+    from gather.index import levenshtein
+    hymns = gather.hymns
+    if title in hymns:
+        return {title: hymns[title]}
+    query = title.lower()
+    best = {}
+    for i, other in enumerate(hymns):
+        folded = other.lower()
+        words = [folded]
+        if folded.endswith(')') and ' (' in folded:
+            words.append(folded[:folded.rindex(' (')])
+        distance = min(levenshtein(query, word) for word in words)
+        if distance <= max_distance:
+            best[i, other] = distance
+    return {other: hymns[other]
+            for i, other in sorted(best, key=lambda key: (best[key], key))}
+
+
+def check(count=200, seed=0):
+    """Check the fast edit distance and find_hymn against plain references.
+
+    Distances between random strings are compared with dynamic
+    programming, and find_hymn results for randomly misspelled titles with
+    a scan of every title.
+
+    Returns:
+        int: Number of mismatches, each of which is printed
+    """
+    from gather.index import levenshtein
+    rng = random.Random(seed)
+    alphabet = 'abcé xyz'
+    mismatches = 0
+    for _ in range(count * 10):
+        a = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(80)))
+        b = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(80)))
+        if levenshtein(a, b) != reference_distance(a, b):
+            mismatches += 1
+            print(f"✗ levenshtein({a!r}, {b!r})")
+    titles = list(gather.hymns)
+    for _ in range(count):
+        chars = list(rng.choice(titles))
+        for _ in range(rng.randrange(5)):
+            position = rng.randrange(len(chars) + 1)
+            if rng.random() < 0.5 and position < len(chars):
+                del chars[position]
+            else:
+                chars.insert(position, rng.choice(alphabet))
+        query = ''.join(chars)
+        for max_distance in (1, 2, 4):
+            if (gather.find_hymn(query, max_distance)
+                    != reference_find_hymn(query, max_distance)):
+                mismatches += 1
+                print(f"✗ find_hymn({query!r}, {max_distance})")
+    print(f"{'✓' if not mismatches else '✗'} Checked levenshtein and "
+          f"find_hymn: {mismatches} mismatches")
+    return mismatches
+
+
+def format_time(seconds):
+    """Format seconds with a unit suited to their size."""
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def report(name, result, baseline=None):
+    """Print one result, and its change from a baseline result if given."""
+    line = f"{name:42} {format_time(result['min'])}  (median {format_time(result['median']).strip()})"
+    if baseline is not None:
+        line += f"  {result['min'] / baseline['min']:6.2f}x"
+    print(line)
+
+
+def compare(results, baseline):
+    """Print each result's fastest time relative to a baseline run."""
+    print(f"\nCompared with {baseline['environment'].get('commit')} "
+          "(ratio of fastest times; below 1 is faster):")
+    for name, result in results['results'].items():
+        if name in baseline['results']:
+            report(name, result, baseline['results'][name])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timings per benchmark (default 5)')
+    parser.add_argument('--filter', metavar='TEXT',
+                        help='only run benchmarks whose name contains TEXT')
+    parser.add_argument('--output', metavar='FILE',
+                        help='write results as JSON to FILE')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='run against a synthetic hymnal of N titles '
+                             '(see generate_synthetic_catalog.py)')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare with results from an earlier --output')
+    parser.add_argument('--check', action='store_true',
+                        help='check edit distances and find_hymn against '
+                             'plain reference implementations, then exit')
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(1 if check() else 0)
+    results = run(args.repeat, args.filter, args.synthetic)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Saved to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(results, json.load(f))
@@ -1,6 +1,64 @@
 """Hymnal Index Data Package"""
 
-from .data import hymns, get_hymn_number, search_hymns
+import os
 
-__all__ = ['hymns', 'get_hymn_number', 'search_hymns']
-__version__ = '0.1.0'
\ No newline at end of file
+# Public name -> submodule defining it. Submodules are imported on first
+# access to one of their names (see __getattr__), so "import gather" itself
+# loads nothing and a single lookup only pays for the modules it uses.
+_EXPORTS = {
+    'hymns': 'data',
+    'get_hymn_number': 'data',
+    'get_hymn_numbers': 'data',
+    'search_hymns': 'data',
+    'search_hymns_many': 'data',
+    'rank_hymns': 'data',
+    'autocomplete': 'data',
+    'find_hymn': 'data',
+    'sounds_like': 'data',
+    'get_titles': 'data',
+    'get_hymns_in_range': 'data',
+    'get_entry': 'catalog',
+    'get_url': 'catalog',
+    'Catalog': 'hymnals',
+    'get_catalog': 'hymnals',
+    'get_mass_part': 'mass',
+    'get_mass_settings': 'mass',
+    'get_mass_setting': 'mass',
+    'find_part': 'mass',
+    'Hymn': 'records',
+    'keyify': 'text',
+    'keyify_many': 'text',
+}
+
+__all__ = ['hymns', 'get_hymn_number', 'get_hymn_numbers', 'search_hymns',
+           'search_hymns_many', 'rank_hymns', 'autocomplete', 'find_hymn',
+           'sounds_like', 'get_titles', 'get_hymns_in_range', 'get_entry',
+           'get_url', 'get_mass_part', 'get_mass_settings', 'get_mass_setting',
+           'find_part', 'keyify', 'keyify_many', 'Hymn', 'Catalog',
+           'get_catalog']
+__version__ = '0.1.0'
+
+if os.environ.get('GATHER_INSTRUMENT'):
+    from . import instrument
+    instrument.enable()
+
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # A relative __import__ with a fromlist returns the submodule itself;
+    # importlib.import_module would cost more than the rest of the package
+    module = __import__(module_name, globals(), None, [name], 1)
+    value = getattr(module, name)
+    # The hymns table is loaded by gather.data on first access; the rest
+    # are kept here so later accesses skip this function
+    if name != 'hymns':
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,93 @@
+"""Song catalog lookups over gather.yml"""
+
+from .instrument import track
+from .loader import load_catalogs
+from .text import fold
+
+
+class EntryIndex:
+    """Lookup indexes over the records of one catalog.
+
+    Records are reachable by their key, any alias of their key, their
+    title, or the folded form of any of these, and by hymn number.
+
+    Args:
+        entries: Dictionary of Hymn records by key, as returned by
+            gather.loader.load_catalog
+    """
+
+    def __init__(self, entries):
+        self.entries = {}
+        self.aliases = {}
+        for key, hymn in entries.items():
+            if hymn.key == key:
+                self.entries[key] = hymn
+            else:
+                self.aliases[key] = hymn.key
+        self.titles = {}
+        self.folded = {}
+        self.numbers = {}
+        for key, hymn in self.entries.items():
+            self.titles.setdefault(hymn.title, key)
+            self.folded.setdefault(fold(hymn.title), key)
+            self.folded.setdefault(fold(key), key)
+            if hymn.number is not None:
+                self.numbers.setdefault(hymn.number, []).append(key)
+        for alias, key in self.aliases.items():
+            self.folded.setdefault(fold(alias), key)
+
+    def find(self, title_or_key):
+        """Get the key of an entry by key or title, or None if not found.
+
+        Keys and titles are matched exactly first, then ignoring accents,
+        case and punctuation. Anything other than a string finds nothing.
+        """
+        if title_or_key in self.entries:
+            return title_or_key
+        key = self.aliases.get(title_or_key)
+        if key is None:
+            key = self.titles.get(title_or_key)
+        if key is None and isinstance(title_or_key, str):
+            key = self.folded.get(fold(title_or_key))
+        return key
+
+
+# Index over gather.yml, built once on first lookup
+_gather_index = None
+
+def _get_gather_index():
+    """Get the index over gather.yml entries."""
+    global _gather_index
+    if _gather_index is None:
+        _gather_index = EntryIndex(load_catalogs(names=['gather'])['gather'])
+    return _gather_index
+
+
+@track(hit=lambda result: result is not None)
+def get_entry(number):
+    """Get the gather.yml entry for a hymn number.
+
+    Returns:
+        Hymn: First record listed under the number, or None if there is
+            none
+    """
+    index = _get_gather_index()
+    keys = index.numbers.get(number)
+    return index.entries[keys[0]] if keys else None
+
+
+@track(hit=lambda result: result is not None)
+def get_url(title_or_key):
+    """Get the sample video URL for a song.
+
+    Args:
+        title_or_key: gather.yml key, such as "a-hymn-of-glory-let-us-sing",
+            or song title; titles are matched ignoring accents, case and
+            punctuation when there is no exact match
+
+    Returns:
+        str: URL, or None if the song is not found or has no URL
+    """
+    index = _get_gather_index()
+    key = index.find(title_or_key)
+    return index.entries[key].url if key is not None else None
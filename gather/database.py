@@ -0,0 +1,387 @@
+"""SQLite storage for the catalogs
+
+As an alternative to loading the hymns table and the YAML catalogs into
+memory, they can be exported once into a SQLite database:
+
+    python -m gather.database
+
+This writes catalog.sqlite next to the YAML files. Opening it takes no
+parsing or index building, so a Database answers its first lookup at once,
+and the same file can be shared by any number of processes. Titles are
+searched through an FTS5 trigram index when the SQLite library provides
+one, and by a plain scan otherwise.
+
+    from gather.database import open_database
+    db = open_database()
+    db.get_hymn_number('Amazing Grace')
+    db.search_hymns('grace')
+
+The database is not updated automatically; export it again after editing
+the catalogs.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
+
+from .loader import CATALOG_FILES, DATA_DIR, load_catalog
+from .records import Hymn
+from .text import fold
+
+DATABASE_FILE = 'catalog.sqlite'
+
+_SCHEMA = """
+CREATE TABLE hymns (
+    title TEXT NOT NULL PRIMARY KEY,
+    folded TEXT NOT NULL,
+    number INTEGER NOT NULL
+);
+CREATE INDEX hymns_folded ON hymns (folded);
+CREATE INDEX hymns_number ON hymns (number);
+CREATE TABLE entries (
+    catalog TEXT NOT NULL,
+    key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    number INTEGER,
+    url TEXT,
+    extras TEXT,
+    folded_title TEXT NOT NULL,
+    folded_key TEXT NOT NULL,
+    PRIMARY KEY (catalog, key)
+);
+CREATE INDEX entries_title ON entries (catalog, title);
+CREATE INDEX entries_folded_title ON entries (catalog, folded_title);
+CREATE INDEX entries_folded_key ON entries (catalog, folded_key);
+CREATE INDEX entries_number ON entries (catalog, number);
+CREATE TABLE aliases (
+    catalog TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    key TEXT NOT NULL,
+    folded_alias TEXT NOT NULL,
+    PRIMARY KEY (catalog, alias)
+);
+CREATE INDEX aliases_folded ON aliases (catalog, folded_alias);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE hymns_fts USING fts5(
+    title, folded, content='hymns', tokenize='trigram'
+);
+INSERT INTO hymns_fts (rowid, title, folded)
+    SELECT rowid, title, folded FROM hymns;
+"""
+
+# Queries, kept as constants so each connection prepares them once and
+# reuses the compiled statements from its statement cache
+_HYMN_NUMBER = "SELECT number FROM hymns WHERE title = ?"
+_FOLDED_NUMBER = """
+    SELECT number FROM hymns WHERE folded = ? ORDER BY rowid LIMIT 1"""
+_SEARCH_FTS = """
+    SELECT title, folded, number FROM hymns WHERE rowid IN (
+        SELECT rowid FROM hymns_fts WHERE title MATCH ?
+        UNION SELECT rowid FROM hymns_fts WHERE folded MATCH ?)
+    ORDER BY rowid"""
+_SEARCH_TITLE_FTS = """
+    SELECT title, folded, number FROM hymns WHERE rowid IN (
+        SELECT rowid FROM hymns_fts WHERE title MATCH ?)
+    ORDER BY rowid"""
+_ALL_HYMNS = "SELECT title, folded, number FROM hymns ORDER BY rowid"
+_TITLES = "SELECT title FROM hymns WHERE number = ? ORDER BY rowid"
+_RANGE = """
+    SELECT title, number FROM hymns WHERE number BETWEEN ? AND ?
+    ORDER BY number, rowid"""
+_ENTRY_COLUMNS = "key, title, number, url, extras"
+_ENTRY_BY_NUMBER = f"""
+    SELECT {_ENTRY_COLUMNS} FROM entries WHERE catalog = ? AND number = ?
+    ORDER BY rowid LIMIT 1"""
+# Key, alias, title, then folded title, key or alias, as EntryIndex.find
+_ENTRY_BY_KEY = f"""
+    SELECT {_ENTRY_COLUMNS} FROM entries WHERE catalog = ? AND key = ?"""
+_ENTRY_BY_ALIAS = f"""
+    SELECT {_ENTRY_COLUMNS} FROM entries WHERE catalog = ? AND key = (
+        SELECT key FROM aliases WHERE catalog = ? AND alias = ?)"""
+_ENTRY_BY_TITLE = f"""
+    SELECT {_ENTRY_COLUMNS} FROM entries WHERE catalog = ? AND title = ?
+    ORDER BY rowid LIMIT 1"""
+_ENTRY_BY_FOLDED = f"""
+    SELECT {_ENTRY_COLUMNS} FROM entries WHERE catalog = ? AND key = (
+        SELECT key FROM (
+            SELECT 0 AS kind, rowid, key FROM entries
+                WHERE catalog = ? AND folded_title = ?
+            UNION ALL SELECT 1, rowid, key FROM entries
+                WHERE catalog = ? AND folded_key = ?
+            UNION ALL SELECT 2, rowid, key FROM aliases
+                WHERE catalog = ? AND folded_alias = ?)
+        ORDER BY kind, rowid LIMIT 1)"""
+
+
+def export_database(path=None, data_dir=None):
+    """Export the hymns table and the YAML catalogs into a SQLite database.
+
+    The database is written to a temporary file first and then moved into
+    place, so open databases are never seen half written.
+
+    Args:
+        path: Database file to write; defaults to catalog.sqlite in the data
+            directory
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+
+    Returns:
+        str: Path of the database written
+    """
+    from .data import _get_hymns
+    data_dir = data_dir or DATA_DIR
+    path = path or os.path.join(data_dir, DATABASE_FILE)
+    temp_path = path + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript(_SCHEMA)
+        connection.executemany(
+            "INSERT INTO hymns (title, folded, number) VALUES (?, ?, ?)",
+            ((title, fold(title), number)
+             for title, number in _get_hymns().items()))
+        try:
+            connection.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            pass  # No FTS5 or no trigram tokenizer; titles are scanned
+        for name, file_name in CATALOG_FILES.items():
+            catalog = load_catalog(os.path.join(data_dir, file_name))
+            connection.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((name, key, hymn.title, hymn.number, hymn.url,
+                  json.dumps(hymn.extras) if hymn.extras else None,
+                  fold(hymn.title), fold(key))
+                 for key, hymn in catalog.items() if hymn.key == key))
+            connection.executemany(
+                "INSERT INTO aliases VALUES (?, ?, ?, ?)",
+                ((name, alias, hymn.key, fold(alias))
+                 for alias, hymn in catalog.items() if hymn.key != alias))
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temp_path, path)
+    return path
+
+
+class ConnectionPool:
+    """Small pool of read-only connections to a SQLite database.
+
+    Connections are opened as needed, up to size, and handed out to one
+    thread at a time; callers beyond that wait for a connection to be
+    returned.
+
+    Args:
+        path: Database file
+        size: Maximum number of open connections
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open a new read-only connection."""
+        uri = 'file:' + pathname2url(os.path.abspath(self.path)) + '?mode=ro'
+        return sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=64)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a with block."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                opened = self._opened < self.size
+                if opened:
+                    self._opened += 1
+            connection = self._open() if opened else self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+
+
+def _hymn(row):
+    """Get a Hymn record from an entries row."""
+    if row is None:
+        return None
+    key, title, number, url, extras = row
+    return Hymn(key, title, number, url, url is not None,
+                json.loads(extras) if extras else None)
+
+
+def _quote(term):
+    """Quote a term as an FTS5 string, matching it as a substring."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class Database:
+    """Catalog lookups against an exported SQLite database.
+
+    Methods match the module-level functions of the same name and return
+    the same results.
+
+    Args:
+        path: Database file; defaults to catalog.sqlite in DATA_DIR
+        pool_size: Maximum number of open connections
+    """
+
+    def __init__(self, path=None, pool_size=4):
+        self.path = path or os.path.join(DATA_DIR, DATABASE_FILE)
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(
+                f"No catalog database at {self.path}; "
+                "run python -m gather.database")
+        self.pool = ConnectionPool(self.path, pool_size)
+        with self.pool.connection() as connection:
+            self.fts = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'hymns_fts'"
+            ).fetchone() is not None
+
+    def close(self):
+        """Close the database's connections."""
+        self.pool.close()
+
+    def get_hymn_number(self, title):
+        """Get hymn number by title, as gather.get_hymn_number."""
+        with self.pool.connection() as connection:
+            row = connection.execute(_HYMN_NUMBER, (title,)).fetchone()
+            if row is None and isinstance(title, str):
+                row = connection.execute(
+                    _FOLDED_NUMBER, (fold(title),)).fetchone()
+        return row[0] if row is not None else None
+
+    def get_hymn_numbers(self, titles):
+        """Get hymn numbers for many titles, as gather.get_hymn_numbers."""
+        titles = list(titles)
+        numbers = {}
+        for title in titles:
+            if title not in numbers:
+                numbers[title] = self.get_hymn_number(title)
+        return [numbers[title] for title in titles]
+
+    def search_hymns(self, search_term):
+        """Search for hymns by partial title, as gather.search_hymns.
+
+        Terms of three or more characters are looked up in the trigram
+        index; candidates are then checked exactly as in memory.
+        """
+        term = search_term.lower()
+        folded = fold(search_term)
+        with self.pool.connection() as connection:
+            if self.fts and len(term) >= 3 and len(folded) >= 3:
+                rows = connection.execute(
+                    _SEARCH_FTS, (_quote(search_term), _quote(folded)))
+            elif self.fts and len(term) >= 3 and not folded:
+                rows = connection.execute(
+                    _SEARCH_TITLE_FTS, (_quote(search_term),))
+            else:
+                rows = connection.execute(_ALL_HYMNS)
+            return {title: number for title, title_folded, number in rows
+                    if term in title.lower()
+                    or (folded and folded in title_folded)}
+
+    def search_hymns_many(self, search_terms):
+        """Search for hymns by many partial titles at once.
+
+        Repeated terms get copies of the first result, as in
+        gather.search_hymns_many.
+        """
+        search_terms = list(search_terms)
+        results = {}
+        output = []
+        for term in search_terms:
+            result = results.get(term)
+            if result is None:
+                result = results[term] = self.search_hymns(term)
+            else:
+                result = dict(result)
+            output.append(result)
+        return output
+
+    def get_titles(self, number):
+        """Get all titles listed under a hymn number."""
+        with self.pool.connection() as connection:
+            return [title for title, in connection.execute(
+                _TITLES, (number,))]
+
+    def get_hymns_in_range(self, start, end):
+        """Get hymns numbered from start to end, inclusive."""
+        with self.pool.connection() as connection:
+            return dict(connection.execute(_RANGE, (start, end)))
+
+    def get_entry(self, number, catalog='gather'):
+        """Get the first entry of a catalog listed under a hymn number."""
+        with self.pool.connection() as connection:
+            return _hymn(connection.execute(
+                _ENTRY_BY_NUMBER, (catalog, number)).fetchone())
+
+    def find_entry(self, title_or_key, catalog='gather'):
+        """Get a catalog entry by key, alias or title.
+
+        Matching follows gather.catalog.EntryIndex.find.
+
+        Returns:
+            Hymn: Record, or None if not found
+        """
+        if not isinstance(title_or_key, str):
+            return None
+        folded = fold(title_or_key)
+        with self.pool.connection() as connection:
+            for query, parameters in (
+                    (_ENTRY_BY_KEY, (catalog, title_or_key)),
+                    (_ENTRY_BY_ALIAS, (catalog, catalog, title_or_key)),
+                    (_ENTRY_BY_TITLE, (catalog, title_or_key)),
+                    (_ENTRY_BY_FOLDED, (catalog,) + (catalog, folded) * 3)):
+                row = connection.execute(query, parameters).fetchone()
+                if row is not None:
+                    return _hymn(row)
+        return None
+
+    def get_url(self, title_or_key):
+        """Get the sample video URL for a song, as gather.get_url."""
+        hymn = self.find_entry(title_or_key)
+        return hymn.url if hymn is not None else None
+
+    def get_mass_part(self, title_or_key):
+        """Get a mass-settings.yml entry, as gather.get_mass_part."""
+        return self.find_entry(title_or_key, catalog='mass-settings')
+
+
+# Database opened by open_database, shared by its callers
+_database = None
+
+def open_database(path=None, pool_size=4):
+    """Get the shared Database, opening it on first use.
+
+    Raises:
+        FileNotFoundError: If the database has not been exported
+    """
+    global _database
+    if _database is None:
+        _database = Database(path, pool_size)
+    return _database
+
+
+if __name__ == '__main__':
+    print(f"✓ Saved to {export_database()}")
@@ -0,0 +1,154 @@
+"""Lookups across several hymnals"""
+
+from . import data
+from .loader import load_catalog
+
+
+def join_key(hymnal, number):
+    """Get the namespaced key of a hymn, such as "gather:545"."""
+    return f'{hymnal}:{number}'
+
+
+def split_key(key):
+    """Split a namespaced key into its hymnal name and hymn number.
+
+    Returns:
+        tuple: Hymnal name and number; the number is an int when it is
+            all digits, as in "gather:545", and a string otherwise
+    """
+    hymnal, _, number = key.partition(':')
+    return hymnal, int(number) if number.isdigit() else number
+
+
+def hymnal_from_catalog(path):
+    """Get the title -> number table of a YAML catalog in gather.yml form.
+
+    Entries without a number are left out.
+    """
+    return {hymn.title: hymn.number for key, hymn in load_catalog(path).items()
+            if hymn.key == key and hymn.number is not None}
+
+
+class Catalog:
+    """Combined title index over several hymnals.
+
+    Every hymn is identified by a namespaced key joining the hymnal name
+    and its number, such as "gather:545". Each distinct title is indexed
+    once, however many hymnals list it, and lookups return every key it
+    is listed under, so one search covers all hymnals. The search indexes
+    are built on first use and shared by all lookups.
+
+    Args:
+        hymnals: Dictionary of hymnals by name; each hymnal is a title ->
+            number dictionary, like gather.data.hymns, or the path of a
+            YAML catalog in gather.yml form
+
+    Raises:
+        ValueError: If a hymnal name contains ":"
+    """
+
+    def __init__(self, hymnals):
+        self.hymnals = []
+        self.titles = []
+        self.title_keys = []
+        self.keys = {}
+        positions = {}
+        for name, hymns in hymnals.items():
+            if ':' in name:
+                raise ValueError(f"Hymnal name {name!r} contains ':'")
+            if isinstance(hymns, str):
+                hymns = hymnal_from_catalog(hymns)
+            self.hymnals.append(name)
+            for title, number in hymns.items():
+                key = join_key(name, number)
+                i = positions.get(title)
+                if i is None:
+                    i = positions[title] = len(self.titles)
+                    self.titles.append(title)
+                    self.title_keys.append([])
+                self.title_keys[i].append(key)
+                self.keys.setdefault(key, []).append(title)
+        self._positions = positions
+        self._indexes = {}
+
+    # Index name -> function building it from the list of distinct titles;
+    # the same indexes as over the package's own hymnal
+    INDEX_BUILDERS = {name: data.INDEX_BUILDERS[name] for name in (
+        'folded_keys', 'title', 'folded', 'ranking', 'prefix')}
+
+    def _get_index(self, name):
+        """Get an index over the titles, building it on first use."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = self.INDEX_BUILDERS[name](
+                self.titles)
+        return index
+
+    def _results(self, positions):
+        """Get the keys of the titles at some positions, by title."""
+        return {self.titles[i]: list(self.title_keys[i]) for i in positions}
+
+    def get_keys(self, title):
+        """Get the keys of every hymn with a title.
+
+        Titles are matched exactly first, then ignoring accents, case and
+        punctuation.
+
+        Returns:
+            list: Namespaced keys, such as ["gather:645"], in hymnal order
+        """
+        i = self._positions.get(title)
+        if i is None and isinstance(title, str):
+            i = data._lookup(title, self._positions,
+                             self._get_index('folded_keys'))
+        return list(self.title_keys[i]) if i is not None else []
+
+    def get_titles(self, key):
+        """Get all titles listed under a namespaced key, such as "gather:545"."""
+        return list(self.keys.get(key, ()))
+
+    def search(self, search_term):
+        """Search all hymnals by partial title match.
+
+        A title matches if it contains the search term ignoring case, or
+        ignoring accents, case and punctuation.
+
+        Returns:
+            dict: Namespaced keys of each matching title
+        """
+        return self._results(data._search_positions(
+            search_term, self._get_index('title'), self._get_index('folded')))
+
+    def rank(self, query, limit=10):
+        """Search all hymnals by relevance to the words of a query.
+
+        Returns:
+            dict: Namespaced keys of up to limit titles, most relevant
+                first
+        """
+        return self._results(
+            i for i, score in self._get_index('ranking').search(query, limit))
+
+    def autocomplete(self, prefix, limit=10):
+        """Complete a partially typed title from all hymnals.
+
+        Returns:
+            dict: Namespaced keys of up to limit titles starting with the
+                prefix, then of titles with a later word starting with it
+        """
+        return self._results(self._get_index('prefix').search(prefix, limit))
+
+
+# Catalog over the package's own hymnal, built once on first use
+_catalog = None
+
+def get_catalog():
+    """Get the shared Catalog over the Gather hymnal, as hymnal "gather"."""
+    global _catalog
+    if _catalog is None:
+        _catalog = Catalog({'gather': data._get_hymns()})
+        # The titles are the hymns table's, in the same order, so the
+        # package's indexes (possibly from the snapshot) serve as is
+        for name in Catalog.INDEX_BUILDERS:
+            _catalog._indexes[name] = data._get_index(name)
+    return _catalog
@@ -0,0 +1,343 @@
+"""Search indexes over hymn titles"""
+
+import heapq
+import math
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+
+
+def _trigrams(string):
+    """Get the set of three-character substrings of a string."""
+    return {string[i:i + 3] for i in range(len(string) - 2)}
+
+
+class TrigramIndex:
+    """Trigram inverted index for substring search over a list of titles.
+
+    Each title is normalized once when the index is built. A query is
+    normalized the same way, the posting lists of its trigrams are
+    intersected, and only the surviving candidates are checked with a
+    plain substring test. Queries shorter than three characters have no
+    trigrams and fall back to a linear scan.
+
+    Args:
+        titles: Iterable of titles to index
+        normalize: Function applied to titles and queries before matching
+    """
+
+    def __init__(self, titles, normalize=str.lower):
+        self.titles = list(titles)
+        self.normalize = normalize
+        self.folded = [normalize(title) for title in self.titles]
+        postings = {}
+        for i, folded in enumerate(self.folded):
+            for gram in _trigrams(folded):
+                postings.setdefault(gram, []).append(i)
+        self.postings = postings
+
+    def search(self, term):
+        """Get positions of titles containing term, in title order."""
+        term = self.normalize(term)
+        folded = self.folded
+        if len(term) < 3:
+            return [i for i, title in enumerate(folded) if term in title]
+        lists = []
+        for gram in _trigrams(term):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            lists.append(posting)
+        lists.sort(key=len)
+        if len(lists) == 1:
+            candidates = lists[0]
+        else:
+            matches = set(lists[0])
+            for posting in lists[1:]:
+                matches.intersection_update(posting)
+                if not matches:
+                    return []
+            candidates = sorted(matches)
+        return [i for i in candidates if term in folded[i]]
+
+
+class BM25Index:
+    """Token inverted index with Okapi BM25 relevance ranking.
+
+    Titles are normalized and split on whitespace into tokens. Each token
+    maps to a posting list of (position, term frequency) pairs, so a query
+    only scores titles that share at least one token with it.
+
+    Args:
+        titles: Iterable of titles to index
+        normalize: Function applied to titles and queries before
+            tokenizing
+        k1: Term-frequency saturation parameter
+        b: Length-normalization parameter
+    """
+
+    def __init__(self, titles, normalize=str.lower, k1=1.2, b=0.75):
+        self.titles = list(titles)
+        self.normalize = normalize
+        self.k1 = k1
+        self.b = b
+        postings = {}
+        lengths = []
+        for i, title in enumerate(self.titles):
+            tokens = normalize(title).split()
+            lengths.append(len(tokens))
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                postings.setdefault(token, []).append((i, count))
+        self.postings = postings
+        self.lengths = lengths
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0
+
+    def search(self, query, limit=10):
+        """Get (position, score) pairs for the best-scoring titles.
+
+        Only the top limit results are kept, highest score first; ties go
+        to the title indexed first.
+        """
+        n = len(self.titles)
+        k1, b = self.k1, self.b
+        lengths, average_length = self.lengths, self.average_length
+        scores = {}
+        for token in set(self.normalize(query).split()):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for i, count in posting:
+                norm = k1 * (1 - b + b * lengths[i] / average_length)
+                scores[i] = (scores.get(i, 0.0)
+                             + idf * count * (k1 + 1) / (count + norm))
+        return heapq.nsmallest(limit, scores.items(),
+                               key=lambda item: (-item[1], item[0]))
+
+
+class PhoneticIndex:
+    """Inverted index from phonetic word codes to titles.
+
+    Every word of every normalized title is encoded once when the index is
+    built. A query is encoded the same way and only titles sharing a code
+    with it are ranked, by the overlap between their sets of codes, with
+    each shared code weighted by how closely the query word is spelled
+    like the title word sharing it.
+
+    Args:
+        titles: Iterable of titles to index
+        encode: Function mapping a word to its phonetic code
+        normalize: Function applied to titles and queries before
+            splitting into words
+    """
+
+    def __init__(self, titles, encode, normalize=str.lower):
+        self.titles = list(titles)
+        self.encode = encode
+        self.normalize = normalize
+        postings = {}
+        words = []
+        for i, title in enumerate(self.titles):
+            coded = {}
+            for word in normalize(title).split():
+                coded.setdefault(encode(word), []).append(word)
+            words.append(coded)
+            for code in coded:
+                postings.setdefault(code, []).append(i)
+        self.postings = postings
+        self.words = words
+
+    def search(self, query, limit=10):
+        """Get (position, score) pairs for the best-matching titles.
+
+        The score is a weighted Jaccard similarity between the query's and
+        the title's sets of codes: each shared code counts as the spelling
+        similarity (one minus the edit distance over the longer length) of
+        the query word and the closest title word with that code, so
+        "Shepard" ranks "Shepherd" above "Spirit", though all three are
+        S163. Only the top limit results are kept, highest score first;
+        ties go to the title indexed first.
+        """
+        coded = {}
+        for word in self.normalize(query).split():
+            coded.setdefault(self.encode(word), []).append(word)
+        candidates = set()
+        for code in coded:
+            candidates.update(self.postings.get(code, ()))
+        scores = []
+        for i in candidates:
+            title_words = self.words[i]
+            weight = shared = 0
+            for code, query_words in coded.items():
+                matches = title_words.get(code)
+                if matches is not None:
+                    shared += 1
+                    weight += max(1 - levenshtein(a, b) / max(len(a), len(b))
+                                  for a in query_words for b in matches)
+            scores.append((i, weight / (len(coded) + len(title_words)
+                                        - shared)))
+        return heapq.nsmallest(limit, scores,
+                               key=lambda item: (-item[1], item[0]))
+
+
+def _pattern(string):
+    """Get the per-character match bitmasks of a string."""
+    peq = {}
+    for i, char in enumerate(string):
+        peq[char] = peq.get(char, 0) | 1 << i
+    return peq
+
+
+def _distance(peq, m, text, limit=None):
+    """Get the edit distance between a pattern of length m and text.
+
+    Uses Hyyrö's bit-parallel formulation of Myers' algorithm, which
+    processes one character of text per step instead of filling in a full
+    dynamic-programming table. When limit is given, gives up as soon as
+    the distance is known to exceed it and returns some value above limit.
+    """
+    if not m:
+        return len(text)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    remaining = len(text)
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        if limit is not None and score - remaining > limit:
+            return limit + 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def levenshtein(a, b):
+    """Get the edit distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    return _distance(_pattern(b), len(b), a)
+
+
+class PrefixIndex:
+    """Sorted-array index for prefix (as-you-type) search over titles.
+
+    Keeps two sorted columns: every normalized title, and every suffix of
+    a normalized title that starts at a word boundary. A query bisects to
+    the first key with its prefix and reads forward only until the limit
+    is reached, so its cost does not depend on the number of titles.
+
+    Args:
+        titles: Iterable of titles to index
+        normalize: Function applied to titles and queries before matching
+    """
+
+    def __init__(self, titles, normalize=str.lower):
+        self.titles = list(titles)
+        self.normalize = normalize
+        title_keys, word_keys = [], []
+        for i, title in enumerate(self.titles):
+            folded = normalize(title)
+            title_keys.append((folded, i))
+            for j in range(1, len(folded)):
+                if folded[j - 1] == ' ' and folded[j] != ' ':
+                    word_keys.append((folded[j:], i))
+        self.columns = []
+        for keys in (sorted(title_keys), sorted(word_keys)):
+            self.columns.append(([key for key, i in keys],
+                                 [i for key, i in keys]))
+
+    def search(self, prefix, limit=10):
+        """Get positions of up to limit titles starting with prefix.
+
+        Titles that start with the prefix come first, followed by titles
+        with a later word that starts with it, each in sorted order.
+        """
+        prefix = self.normalize(prefix)
+        results = []
+        seen = set()
+        for keys, positions in self.columns:
+            i = bisect_left(keys, prefix)
+            while (len(results) < limit and i < len(keys)
+                   and keys[i].startswith(prefix)):
+                if positions[i] not in seen:
+                    seen.add(positions[i])
+                    results.append(positions[i])
+                i += 1
+        return results
+
+
+class EditDistanceIndex:
+    """Padded-trigram filter for approximate matching under edit distance.
+
+    Every word is padded with two marker characters at each end, so a word
+    of length n has n + 2 trigram occurrences, and one edit changes at most
+    three of them. A word within distance k of the query therefore still
+    contains all but at most 3k of the query's distinct trigrams. A search
+    counts shared trigrams from the posting lists, and only words passing
+    that count and the length bound are compared with the bit-parallel
+    distance, which gives up as soon as k is exceeded. Queries too short
+    for the count to prune are checked against every word of a suitable
+    length.
+
+    Args:
+        words: Iterable of (word, value) pairs; duplicate words collect
+            all of their values
+    """
+
+    def __init__(self, words=()):
+        self.words = []
+        self.values = []
+        ids = {}
+        for word, value in words:
+            i = ids.get(word)
+            if i is None:
+                i = ids[word] = len(self.words)
+                self.words.append(word)
+                self.values.append([])
+            self.values[i].append(value)
+        postings = {}
+        for i, word in enumerate(self.words):
+            for gram in _padded_trigrams(word):
+                postings.setdefault(gram, []).append(i)
+        self.postings = postings
+
+    def search(self, word, max_distance):
+        """Get (distance, value) pairs for words within max_distance."""
+        grams = _padded_trigrams(word)
+        needed = len(grams) - 3 * max_distance
+        if needed > 0:
+            counts = Counter(chain.from_iterable(
+                self.postings.get(gram, ()) for gram in grams))
+            candidates = sorted(i for i, count in counts.items()
+                                if count >= needed)
+        else:
+            candidates = range(len(self.words))
+        peq, m = _pattern(word), len(word)
+        results = []
+        for i in candidates:
+            other = self.words[i]
+            if abs(len(other) - m) > max_distance:
+                continue
+            distance = _distance(peq, m, other, max_distance)
+            if distance <= max_distance:
+                results.extend((distance, value) for value in self.values[i])
+        return results
+
+
+def _padded_trigrams(word):
+    """Get the set of trigrams of a word padded with two markers each side."""
+    return _trigrams('\x02\x02' + word + '\x03\x03')
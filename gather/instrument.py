@@ -0,0 +1,228 @@
+"""Opt-in counters and timings for the lookup functions
+
+Lookup functions are registered with the track decorator, which returns
+them unchanged, so they cost nothing extra until instrumentation is turned
+on. enable() then replaces each registered function, in its module and in
+the gather package, with a wrapper counting calls, hits and misses and
+recording latencies in a histogram; disable() puts the originals back.
+Code holding its own reference to a function, e.g. from an earlier
+"from gather import get_hymn_number", keeps calling the original; set the
+GATHER_INSTRUMENT environment variable to enable instrumentation as soon
+as the package is imported.
+
+Loads of the hymns table, indexes, snapshot and catalogs are rare, so
+their timings are always recorded. The module only imports what the
+interpreter has already loaded, since the lookup modules import it for
+track even when instrumentation stays off.
+
+    from gather import instrument
+    instrument.enable()
+    ...
+    instrument.get_metrics()     # dictionary
+    instrument.to_prometheus()   # Prometheus text exposition format
+"""
+
+import _thread
+import sys
+import time
+
+# Upper bounds, in seconds, of the latency histogram buckets
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+           1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+# Registered functions: (module name, function name, function, hit test)
+_tracked = []
+_enabled = False
+# threading.Lock, without importing threading
+_lock = _thread.allocate_lock()
+# Function name -> [calls, hits, misses, total seconds, bucket counts]
+_calls = {}
+# Load name -> [count, total seconds, last seconds]
+_loads = {}
+
+
+def track(hit=None):
+    """Register a lookup function for instrumentation.
+
+    Functions registered while instrumentation is on, i.e. in modules
+    imported after enable(), are wrapped straight away.
+
+    Args:
+        hit: Function telling from a result whether the lookup found
+            anything, or None to count calls only
+    """
+    def register(function):
+        _tracked.append((function.__module__, function.__name__, function,
+                         hit))
+        return _instrumented(function, hit) if _enabled else function
+    return register
+
+
+def _instrumented(function, hit):
+    """Wrap a function to record its calls."""
+    import functools
+    name = function.__name__
+    bounds = BUCKETS
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        with _lock:
+            stats = _calls.get(name)
+            if stats is None:
+                stats = _calls[name] = [0, 0, 0, 0.0, [0] * len(bounds)]
+            stats[0] += 1
+            if hit is not None:
+                stats[1 if hit(result) else 2] += 1
+            stats[3] += elapsed
+            for i, bound in enumerate(bounds):
+                if elapsed <= bound:
+                    stats[4][i] += 1
+                    break
+        return result
+
+    wrapper.__wrapped_original__ = function
+    return wrapper
+
+
+def _swap(replace):
+    """Swap each tracked function in its module and the package."""
+    package = sys.modules.get(__package__)
+    for module_name, name, function, hit in _tracked:
+        new = replace(function, hit)
+        for module in (sys.modules.get(module_name), package):
+            current = getattr(module, name, None)
+            if current is function or getattr(
+                    current, '__wrapped_original__', None) is function:
+                setattr(module, name, new)
+
+
+def enable():
+    """Start recording calls of the lookup functions."""
+    global _enabled
+    if not _enabled:
+        _swap(_instrumented)
+        _enabled = True
+
+
+def disable():
+    """Stop recording calls; recorded metrics are kept."""
+    global _enabled
+    if _enabled:
+        _swap(lambda function, hit: function)
+        _enabled = False
+
+
+def is_enabled():
+    """Get whether calls are being recorded."""
+    return _enabled
+
+
+def reset():
+    """Clear all recorded calls and loads."""
+    with _lock:
+        _calls.clear()
+        _loads.clear()
+
+
+def record_load(name, seconds):
+    """Record that something, such as "hymns" or "index:title", was loaded."""
+    with _lock:
+        stats = _loads.get(name)
+        if stats is None:
+            stats = _loads[name] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = seconds
+
+
+class timed_load:
+    """Record the time a with block takes as a load; see record_load."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            record_load(self.name, time.perf_counter() - self.start)
+
+
+def get_metrics():
+    """Get everything recorded so far.
+
+    Returns:
+        dict: "enabled"; "calls", by function name, with calls, hits,
+            misses, seconds and cumulative histogram buckets (upper bound
+            -> calls taking at most that long); and "loads", by name, with
+            count, seconds and last_seconds
+    """
+    with _lock:
+        calls = {}
+        for name, (count, hits, misses, seconds, buckets) in _calls.items():
+            cumulative, running = {}, 0
+            for bound, bucket in zip(BUCKETS, buckets):
+                running += bucket
+                cumulative[bound] = running
+            cumulative[float('inf')] = count
+            calls[name] = {'calls': count, 'hits': hits, 'misses': misses,
+                           'seconds': seconds, 'buckets': cumulative}
+        loads = {name: {'count': count, 'seconds': seconds,
+                        'last_seconds': last}
+                 for name, (count, seconds, last) in _loads.items()}
+    return {'enabled': _enabled, 'calls': calls, 'loads': loads}
+
+
+def _label(value):
+    """Escape a Prometheus label value."""
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def to_prometheus():
+    """Get everything recorded so far in Prometheus text exposition format."""
+    metrics = get_metrics()
+    lines = []
+
+    def family(name, kind, description, samples):
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        lines.extend(samples)
+
+    calls, loads = metrics['calls'], metrics['loads']
+    family('gather_calls_total', 'counter', 'Calls of a lookup function.',
+           [f'gather_calls_total{{function="{_label(name)}"}} {stats["calls"]}'
+            for name, stats in calls.items()])
+    for outcome in ('hits', 'misses'):
+        family(f'gather_lookup_{outcome}_total', 'counter',
+               f'Lookups that found {"something" if outcome == "hits" else "nothing"}.',
+               [f'gather_lookup_{outcome}_total{{function="{_label(name)}"}} '
+                f'{stats[outcome]}'
+                for name, stats in calls.items()
+                if stats['hits'] or stats['misses']])
+    samples = []
+    for name, stats in calls.items():
+        function = _label(name)
+        for bound, count in stats['buckets'].items():
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            samples.append(f'gather_call_duration_seconds_bucket'
+                           f'{{function="{function}",le="{le}"}} {count}')
+        samples.append(f'gather_call_duration_seconds_sum'
+                       f'{{function="{function}"}} {stats["seconds"]!r}')
+        samples.append(f'gather_call_duration_seconds_count'
+                       f'{{function="{function}"}} {stats["calls"]}')
+    family('gather_call_duration_seconds', 'histogram',
+           'Time taken by a lookup function.', samples)
+    family('gather_loads_total', 'counter',
+           'Loads of the hymns table, an index, the snapshot or a catalog.',
+           [f'gather_loads_total{{name="{_label(name)}"}} {stats["count"]}'
+            for name, stats in loads.items()])
+    family('gather_load_seconds_total', 'counter', 'Time spent loading.',
+           [f'gather_load_seconds_total{{name="{_label(name)}"}} '
+            f'{stats["seconds"]!r}'
+            for name, stats in loads.items()])
+    return '\n'.join(lines) + '\n'
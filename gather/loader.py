@@ -0,0 +1,231 @@
+"""Loaders for the gather.yml and mass-settings.yml catalogs"""
+
+import os
+import time
+
+from .instrument import timed_load
+
+# Catalog name -> file name in the data directory
+CATALOG_FILES = {
+    'gather': 'gather.yml',
+    'mass-settings': 'mass-settings.yml',
+}
+
+# Compiled snapshot of the catalogs in the data directory; see gather.snapshot
+SNAPSHOT_FILE = 'catalog.snapshot'
+
+
+def _find_data_dir():
+    """Get the directory holding the YAML catalogs.
+
+    An installed package carries the catalogs inside the package directory
+    (see setup.py); in a source checkout they live at the top of the
+    repository, next to the package.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if os.path.exists(os.path.join(package_dir, CATALOG_FILES['gather'])):
+        return package_dir
+    return os.path.dirname(package_dir)
+
+DATA_DIR = _find_data_dir()
+
+
+# File name -> (YAML loader class name, seconds) of the latest load_yaml
+load_timings = {}
+
+
+def yaml_loader():
+    """Get the fastest available safe YAML loader class.
+
+    This is PyYAML's libyaml-based CSafeLoader, or the pure-Python
+    SafeLoader when PyYAML was built without libyaml.
+    """
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_yaml(path):
+    """Load a YAML catalog file into a dictionary of entries by key.
+
+    The loader used and the time taken are recorded in load_timings.
+    """
+    import yaml
+    loader = yaml_loader()
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        entries = yaml.load(f, Loader=loader) or {}
+    load_timings[os.path.basename(path)] = (loader.__name__,
+                                            time.perf_counter() - start)
+    return entries
+
+
+def load_catalog(path):
+    """Load a YAML catalog file into Hymn records.
+
+    Returns:
+        dict: Hymn record by key. Each alias (see split_aliases) maps to
+            the same record as the key it points at, after all records;
+            a record's own key is always record.key.
+
+    Raises:
+        FileNotFoundError: If the catalog file does not exist
+    """
+    from .records import Hymn
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Catalog file {path} not found; the YAML catalogs are installed "
+            "with the package by setup.py, or read from the top of a source "
+            "checkout")
+    with timed_load('catalog:' + os.path.basename(path)):
+        records, aliases = split_aliases(load_yaml(path))
+        catalog = {key: Hymn.from_entry(key, entry)
+                   for key, entry in records.items()}
+        for alias, key in aliases.items():
+            catalog[alias] = catalog[key]
+    return catalog
+
+
+# Data directory -> Snapshot read from it, or None; see get_snapshot
+_snapshots = {}
+
+
+def get_snapshot(data_dir=None):
+    """Get the snapshot in a data directory, reading it at most once.
+
+    The hymns table, its indexes and the catalogs all come from the same
+    Snapshot, so the file is read, verified and unpickled once per
+    process however many of them are loaded. gather.snapshot is only
+    imported when the file exists.
+
+    Args:
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+
+    Returns:
+        Snapshot: Snapshot sections, or None if there is no usable snapshot
+    """
+    data_dir = data_dir or DATA_DIR
+    if data_dir not in _snapshots:
+        snapshot = None
+        if os.path.exists(os.path.join(data_dir, SNAPSHOT_FILE)):
+            from .snapshot import read_snapshot
+            snapshot = read_snapshot(data_dir=data_dir)
+        _snapshots[data_dir] = snapshot
+    return _snapshots[data_dir]
+
+
+def _signature(path):
+    """Get the modification time and size of a file, or None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# (data directory, catalog name) -> catalog loaded by load_catalogs, and
+# the signature its file had just before it was loaded, which
+# gather.reload compares against to find edits made since
+_loaded = {}
+_signatures = {}
+
+
+def load_catalogs(data_dir=None, names=None):
+    """Load the YAML catalogs.
+
+    A fresh catalog snapshot in the data directory is read if there is one;
+    otherwise each catalog is parsed from its YAML file. Each catalog is
+    loaded at most once per process and shared by later calls.
+
+    Args:
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+        names: Names of the catalogs to load; defaults to all of
+            CATALOG_FILES
+
+    Returns:
+        dict: Catalog name -> dictionary of Hymn records by key, as
+            returned by load_catalog
+    """
+    data_dir = data_dir or DATA_DIR
+    snapshot = None
+    catalogs = {}
+    for name in names or CATALOG_FILES:
+        catalog = _loaded.get((data_dir, name))
+        if catalog is None:
+            path = os.path.join(data_dir, CATALOG_FILES[name])
+            signature = _signature(path)
+            if snapshot is None:
+                snapshot = get_snapshot(data_dir) or {}
+            if 'catalog:' + name in snapshot:
+                catalog = snapshot.get('catalog:' + name)
+            else:
+                catalog = load_catalog(path)
+            _loaded[(data_dir, name)] = catalog
+            _signatures[(data_dir, name)] = signature
+        catalogs[name] = catalog
+    return catalogs
+
+
+def split_aliases(entries):
+    """Separate alias records from the records they point at.
+
+    An alias record has only an alias_of field naming another key, e.g.
+
+        cantus-missae-a-holy:
+            alias_of: cantus-missae-a-sanctus
+
+    Aliases of aliases are followed to the final record.
+
+    Args:
+        entries: Dictionary of catalog entries by key
+
+    Returns:
+        tuple: Dictionary of records by key, and dictionary of the record
+            key each alias resolves to
+
+    Raises:
+        ValueError: If an alias points at a missing key or forms a cycle
+    """
+    records = {}
+    targets = {}
+    for key, entry in entries.items():
+        if isinstance(entry, dict) and 'alias_of' in entry:
+            targets[key] = entry['alias_of']
+        else:
+            records[key] = entry
+    aliases = {}
+    for alias in targets:
+        key, seen = alias, set()
+        while key in targets:
+            if key in seen:
+                raise ValueError(f"Alias cycle through {alias!r}")
+            seen.add(key)
+            key = targets[key]
+        if key not in records:
+            raise ValueError(f"Alias {alias!r} points at missing key {key!r}")
+        aliases[alias] = key
+    return records, aliases
+
+
+def load_sections(path):
+    """Map each top-level key of a YAML catalog to its section heading.
+
+    Sections are introduced by a comment line, such as
+    "# Mass of Creation (Marty Haugen)", that follows a non-comment line;
+    further comment lines directly below a heading are ignored. Keys
+    before the first heading are not included.
+    """
+    sections = {}
+    heading = None
+    previous_comment = False
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#'):
+                if not previous_comment:
+                    heading = line.lstrip('#').strip()
+                previous_comment = True
+                continue
+            previous_comment = False
+            if heading is not None and line[:1] not in ' \t\n' and ':' in line:
+                sections[line.split(':', 1)[0].strip()] = heading
+    return sections
+
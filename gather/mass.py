@@ -0,0 +1,143 @@
+"""Mass settings lookups over mass-settings.yml"""
+
+import os
+import re
+
+from .catalog import EntryIndex
+from .instrument import track
+from .loader import CATALOG_FILES, DATA_DIR, load_catalogs, load_sections
+from .text import fold
+
+# Part name -> folded phrases that identify it in a title, checked in order
+PART_NAMES = {
+    'Kyrie': ('kyrie',),
+    'Gloria': ('gloria',),
+    'Gospel Acclamation': ('gospel acclamation', 'alleluia'),
+    'Holy': ('holy', 'sanctus'),
+    'Memorial Acclamation': ('memorial acclamation',),
+    'Amen': ('amen',),
+    'Lamb of God': ('lamb of god', 'agnus dei'),
+}
+
+# Sections collecting parts of unrelated settings
+_MISCELLANEOUS_SECTIONS = {'Others'}
+
+_PARENTHETICAL = re.compile(r'\s*\([^)]*\)$')
+
+
+def part_name(title):
+    """Get the part name, such as "Holy", for a Mass part title.
+
+    Returns:
+        str: Name from PART_NAMES, or None if the title names no part
+    """
+    folded = ' ' + fold(title) + ' '
+    for name, phrases in PART_NAMES.items():
+        for phrase in phrases:
+            if ' ' + phrase + ' ' in folded:
+                return name
+    return None
+
+
+class MassSettingsIndex:
+    """Setting and part indexes over mass-settings.yml records.
+
+    Titles of the form "Mass of Creation: Gloria" give the setting and
+    part directly. Other entries belong to the setting named by their
+    section heading, with any parenthetical composer removed, except in
+    the "Others" section, whose entries belong to no setting. Alias
+    records are resolved by the underlying EntryIndex, so every part is
+    indexed once under its canonical key.
+
+    Args:
+        entries: Dictionary of Hymn records by key
+        sections: Dictionary of section headings by key
+    """
+
+    def __init__(self, entries, sections):
+        self.catalog = EntryIndex(entries)
+        self.entries = self.catalog.entries
+        self.settings = {}
+        self.setting_names = {}
+        self.parts = {}
+        for key, hymn in self.entries.items():
+            setting, _, part = hymn.title.rpartition(': ')
+            if not setting:
+                section = sections.get(key)
+                if section not in _MISCELLANEOUS_SECTIONS:
+                    setting = _PARENTHETICAL.sub('', section or '')
+            if setting:
+                folded = fold(setting)
+                self.setting_names.setdefault(folded, setting)
+                self.settings.setdefault(folded, []).append(key)
+            name = part_name(part)
+            if name is not None:
+                self.parts.setdefault(name, []).append(key)
+
+
+# Index over mass-settings.yml, built once on first lookup
+_mass_index = None
+
+def _get_mass_index():
+    """Get the index over mass-settings.yml entries."""
+    global _mass_index
+    if _mass_index is None:
+        path = os.path.join(DATA_DIR, CATALOG_FILES['mass-settings'])
+        entries = load_catalogs(names=['mass-settings'])['mass-settings']
+        _mass_index = MassSettingsIndex(entries, load_sections(path))
+    return _mass_index
+
+
+@track(hit=lambda hymn: hymn is not None)
+def get_mass_part(title_or_key):
+    """Get a mass-settings.yml entry by key, alias or title.
+
+    Args:
+        title_or_key: Key, such as "cantus-missae-a-holy", or title;
+            titles are matched ignoring accents, case and punctuation when
+            there is no exact match
+
+    Returns:
+        Hymn: Record, or None if not found
+    """
+    index = _get_mass_index()
+    key = index.catalog.find(title_or_key)
+    return index.entries[key] if key is not None else None
+
+
+@track()
+def get_mass_settings():
+    """Get the names of all Mass settings, in catalog order."""
+    return list(_get_mass_index().setting_names.values())
+
+
+@track(hit=bool)
+def get_mass_setting(name):
+    """Get all parts of a Mass setting.
+
+    Args:
+        name: Setting name, such as "Mass of Joy and Peace", matched
+            ignoring accents, case and punctuation
+
+    Returns:
+        dict: Hymn records of the setting's parts by key, in catalog order
+    """
+    index = _get_mass_index()
+    keys = index.settings.get(fold(name), ())
+    return {key: index.entries[key] for key in keys}
+
+
+@track(hit=bool)
+def find_part(part):
+    """Get every Mass setting's version of a part.
+
+    Args:
+        part: Part name, such as "Gloria"; Latin names such as "Sanctus"
+            and "Agnus Dei" find their English equivalents
+
+    Returns:
+        dict: Hymn records of the matching parts by key, in catalog order
+    """
+    index = _get_mass_index()
+    keys = index.parts.get(part_name(part), ())
+    return {key: index.entries[key] for key in keys}
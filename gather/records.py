@@ -0,0 +1,61 @@
+"""Catalog record types"""
+
+import sys
+from collections import namedtuple
+
+# Fields every YAML entry may have; anything else goes into extras
+_ENTRY_FIELDS = ('original_title', 'original_name', 'number', 'url')
+
+
+class Hymn(namedtuple('Hymn', 'key title number url has_url extras')):
+    """One song in a YAML catalog.
+
+    Records are immutable tuples without a per-instance __dict__. Keys and
+    titles are interned, so the same string shared by several records or
+    catalogs is stored once. Fields are typed when the record is created,
+    so records from every catalog can be filtered and sorted together.
+
+    Attributes:
+        key: Catalog key, such as "a-hymn-of-glory-let-us-sing"
+        title: Original title from the hymnal index
+        number: Hymn number as an int, or None if the song has none ("NA")
+        url: Sample video URL, or None if there is none yet (null or "NA")
+        has_url: Whether url is set
+        extras: Dictionary of any other fields, such as local_path, or None
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_entry(cls, key, entry):
+        """Create a record from a YAML catalog entry.
+
+        Older entries spell original_title as original_name; either is
+        accepted, and the key stands in for a missing title.
+        """
+        title = entry.get('original_title') or entry.get('original_name')
+        url = _url(entry.get('url'))
+        extras = {field: value for field, value in entry.items()
+                  if field not in _ENTRY_FIELDS}
+        return cls(sys.intern(key), sys.intern(str(title or key)),
+                   _number(entry.get('number')), url, url is not None,
+                   extras or None)
+
+
+def _number(value):
+    """Get a catalog number field as an int, or None for "NA" and blanks."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def _url(value):
+    """Get a catalog url field as a string, or None for "NA" and blanks."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value or value.upper() == 'NA':
+        return None
+    return value
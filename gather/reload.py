@@ -0,0 +1,118 @@
+"""Hot reload of the YAML catalogs
+
+Long-running processes, such as gather.server, load gather.yml and
+mass-settings.yml once. A Reloader watches the files and, when one changes,
+builds new indexes for it in a background thread, then swaps them in with a
+single assignment. Lookups fetch the current index once per call and
+indexes are never modified after they are built, so a lookup running during
+a reload sees either the old catalog or the new one, never a mix, and never
+waits for the rebuild.
+
+    from gather.reload import Reloader
+    Reloader(interval=1.0).start()
+"""
+
+import os
+import threading
+
+from . import catalog, loader, mass
+from .loader import (CATALOG_FILES, DATA_DIR, _signature, load_catalog,
+                     load_sections)
+
+
+def _build_gather_index(entries, path):
+    """Build the gather.yml index from its records."""
+    return catalog.EntryIndex(entries)
+
+
+def _build_mass_index(entries, path):
+    """Build the mass-settings.yml index from its records and headings."""
+    return mass.MassSettingsIndex(entries, load_sections(path))
+
+
+# Catalog name -> (index builder, module holding the index, global name)
+_TARGETS = {
+    'gather': (_build_gather_index, catalog, '_gather_index'),
+    'mass-settings': (_build_mass_index, mass, '_mass_index'),
+}
+
+
+class Reloader:
+    """Poll the YAML catalogs and swap in new indexes when they change.
+
+    Each file is compared with the signature it had when its catalog was
+    loaded (see gather.loader.load_catalogs), so edits made before the
+    Reloader was created are picked up too. Catalogs not loaded yet are
+    left alone; their first use reads the current file. The records
+    returned by load_catalogs are replaced along with the index.
+
+    A catalog that fails to load, e.g. because it was read while half
+    saved, leaves the current index in place; the error is kept in
+    last_error and the file is loaded again on its next change.
+
+    Args:
+        interval: Seconds between checks
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+        on_reload: Function called with the catalog name after each swap
+    """
+
+    def __init__(self, interval=1.0, data_dir=None, on_reload=None):
+        self.interval = interval
+        self.on_reload = on_reload
+        self.last_error = None
+        self.data_dir = data_dir or DATA_DIR
+        self.paths = {name: os.path.join(self.data_dir, file_name)
+                      for name, file_name in CATALOG_FILES.items()}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """Reload every loaded catalog whose file changed since it was loaded.
+
+        Returns:
+            list: Names of the catalogs reloaded
+        """
+        reloaded = []
+        for name, path in self.paths.items():
+            loaded = (self.data_dir, name)
+            if loaded not in loader._loaded:
+                continue
+            signature = _signature(path)
+            if (signature is None
+                    or signature == loader._signatures.get(loaded)):
+                continue
+            loader._signatures[loaded] = signature
+            build, module, attribute = _TARGETS[name]
+            try:
+                entries = load_catalog(path)
+                index = build(entries, path)
+            except Exception as error:
+                self.last_error = error
+                continue
+            loader._loaded[loaded] = entries
+            setattr(module, attribute, index)
+            reloaded.append(name)
+            if self.on_reload is not None:
+                self.on_reload(name)
+        return reloaded
+
+    def _run(self):
+        """Check for changes until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """Start checking in a daemon thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='gather-reloader', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop checking and wait for the thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,303 @@
+"""Local HTTP lookup service over the hymn catalogs
+
+A small asyncio HTTP/1.1 server, using only the standard library, that
+answers lookups from the in-memory indexes so callers do not pay for
+interpreter start-up and catalog loading on every request. Every endpoint
+answers GET (and HEAD) with JSON:
+
+    /lookup?title=...             hymn number for a title
+    /search?q=...                 titles containing q
+    /autocomplete?q=...&limit=10  titles starting with q
+    /url?q=...                    sample video URL for a key or title
+    /entry?number=...             gather.yml record for a hymn number
+
+With --instrument, lookups are counted and timed (see gather.instrument)
+and /metrics answers in Prometheus text format. Each process keeps its own
+counters, so instrumentation needs a single worker.
+
+Connections are kept alive between requests. Every response carries an
+ETag derived from the catalog sources and the request, and a matching
+If-None-Match is answered with 304 Not Modified without running the
+lookup. With --reload, edits to the YAML catalogs are picked up without a
+restart (see gather.reload), and the ETags change with them.
+
+Run with:
+
+    python -m gather.server --port 8080 --workers 4 --reload
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import socket
+from urllib.parse import parse_qs, urlsplit
+
+from . import catalog, data, instrument
+from .loader import DATA_DIR
+from .reload import Reloader
+
+# Longest request head (request line and headers) accepted, in bytes
+MAX_HEAD_SIZE = 16384
+
+_REASONS = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    431: 'Request Header Fields Too Large',
+}
+
+
+def _record(hymn):
+    """Get a Hymn record as a JSON-ready dictionary."""
+    return None if hymn is None else hymn._asdict()
+
+
+def _limit(params):
+    """Get the limit query parameter, defaulting to 10."""
+    return int(params.get('limit', 10))
+
+
+# Path -> (required query parameter, function answering the request)
+ENDPOINTS = {
+    '/lookup': ('title', lambda params: {
+        'title': params['title'],
+        'number': data.get_hymn_number(params['title'])}),
+    '/search': ('q', lambda params: data.search_hymns(params['q'])),
+    '/autocomplete': ('q', lambda params: data.autocomplete(
+        params['q'], _limit(params))),
+    '/url': ('q', lambda params: {
+        'q': params['q'],
+        'url': catalog.get_url(params['q'])}),
+    '/entry': ('number', lambda params: _record(catalog.get_entry(
+        int(params['number'])))),
+}
+
+
+def catalog_version():
+    """Get a fingerprint of the catalog sources, for ETags."""
+    from .snapshot import _checksums
+    checksums = _checksums(DATA_DIR)
+    blob = json.dumps(checksums, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def warm_up():
+    """Load the catalogs and build every index before serving."""
+    for name in data.INDEX_BUILDERS:
+        data._get_index(name)
+    catalog._get_gather_index()
+
+
+def _etag_matches(etag, if_none_match):
+    """Tell whether an If-None-Match header value matches an ETag.
+
+    The value is "*" or a comma-separated list of ETags, compared weakly,
+    i.e. ignoring any W/ prefix.
+    """
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == '*' or candidate == etag:
+            return True
+    return False
+
+
+class LookupServer:
+    """HTTP/1.1 lookup server.
+
+    Args:
+        version: Catalog fingerprint mixed into every ETag; defaults to
+            catalog_version()
+        keep_alive_timeout: Seconds an idle connection is kept open
+    """
+
+    def __init__(self, version=None, keep_alive_timeout=15.0):
+        self.version = version or catalog_version()
+        self.keep_alive_timeout = keep_alive_timeout
+
+    def refresh(self, name=None):
+        """Recompute the catalog fingerprint after a catalog changed."""
+        self.version = catalog_version()
+
+    def etag(self, target):
+        """Get the ETag for a request target under the current catalog."""
+        digest = hashlib.sha256(
+            (self.version + target).encode('utf-8')).hexdigest()
+        return f'"{digest[:32]}"'
+
+    def respond(self, method, target, headers):
+        """Answer one request.
+
+        Returns:
+            tuple: Status code, extra headers and body bytes
+        """
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, b''
+        url = urlsplit(target)
+        if url.path == '/metrics' and instrument.is_enabled():
+            return 200, {
+                'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+                'Cache-Control': 'no-store',
+            }, instrument.to_prometheus().encode('utf-8')
+        endpoint = ENDPOINTS.get(url.path)
+        if endpoint is None:
+            return 404, {}, b''
+        required, answer = endpoint
+        params = {name: values[0] for name, values in parse_qs(
+            url.query, keep_blank_values=True).items()}
+        if required not in params:
+            return 400, {}, b''
+        etag = self.etag(target)
+        cache_headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if _etag_matches(etag, headers.get('if-none-match', '')):
+            return 304, cache_headers, b''
+        try:
+            result = answer(params)
+        except ValueError:
+            return 400, {}, b''
+        body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        cache_headers['Content-Type'] = 'application/json; charset=utf-8'
+        return 200, cache_headers, body
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it is closed."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'),
+                        self.keep_alive_timeout)
+                except asyncio.LimitOverrunError:
+                    await self._write(writer, 'HEAD', 431, {}, b'', False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ')
+                except ValueError:
+                    await self._write(writer, 'GET', 400, {}, b'', False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                # Discard any request body
+                length = headers.get('content-length') or '0'
+                if not length.isdecimal():
+                    await self._write(writer, method, 400, {}, b'', False)
+                    break
+                if int(length):
+                    try:
+                        await asyncio.wait_for(
+                            reader.readexactly(int(length)),
+                            self.keep_alive_timeout)
+                    except (asyncio.IncompleteReadError,
+                            asyncio.TimeoutError):
+                        await self._write(writer, method, 400, {}, b'',
+                                          False)
+                        break
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' if version == 'HTTP/1.1'
+                              else connection == 'keep-alive')
+                status, extra, body = self.respond(method, target, headers)
+                await self._write(writer, method, status, extra, body,
+                                  keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer, method, status, headers, body, keep_alive):
+        """Write one response."""
+        lines = [f'HTTP/1.1 {status} {_REASONS[status]}']
+        headers = dict(headers)
+        headers['Content-Length'] = str(len(body))
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(body)
+        await writer.drain()
+
+    async def serve(self, sock):
+        """Serve connections on a listening socket forever."""
+        server = await asyncio.start_server(self.handle, sock=sock,
+                                            limit=MAX_HEAD_SIZE)
+        async with server:
+            await server.serve_forever()
+
+
+def serve(host='127.0.0.1', port=8080, workers=1, reload_interval=None):
+    """Run the lookup server.
+
+    The catalogs and indexes are loaded once before any worker starts.
+    With more than one worker, the process forks after loading, so the
+    workers share the loaded indexes copy-on-write and accept connections
+    from the same listening socket.
+
+    Args:
+        host: Address to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+        reload_interval: Seconds between checks of the YAML catalogs for
+            changes, or None to never reload
+
+    Raises:
+        ValueError: If instrumentation is on and workers is more than one;
+            each worker would count its own calls, and /metrics would
+            report whichever worker answered the scrape
+    """
+    if workers > 1 and instrument.is_enabled():
+        raise ValueError("Instrumentation needs a single worker")
+    warm_up()
+    server = LookupServer()
+    sock = socket.create_server((host, port), backlog=1024)
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            children = []
+            break
+        children.append(pid)
+    if reload_interval is not None:
+        # Started after forking, since threads do not survive a fork
+        Reloader(reload_interval, on_reload=server.refresh).start()
+    try:
+        asyncio.run(server.serve(sock))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            os.waitpid(pid, 0)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of worker processes')
+    parser.add_argument('--reload', type=float, nargs='?', const=1.0,
+                        metavar='SECONDS',
+                        help='reload the YAML catalogs when they change, '
+                             'checking every SECONDS (default 1)')
+    parser.add_argument('--instrument', action='store_true',
+                        help='count and time lookups, served at /metrics; '
+                             'needs --workers 1')
+    args = parser.parse_args()
+    if args.instrument and args.workers > 1:
+        parser.error('--instrument needs a single worker')
+    if args.instrument:
+        instrument.enable()
+    serve(args.host, args.port, args.workers, args.reload)
@@ -0,0 +1,182 @@
+"""Compiled binary snapshot of the hymn catalogs
+
+Parsing gather.yml and mass-settings.yml with PyYAML dominates start-up
+time. A snapshot holds the parsed catalogs, the hymns table and its
+prebuilt indexes in one file, each pickled as a separate section so a
+process only unpickles the parts it uses. The file starts with a magic
+string, a format version and a SHA-256 checksum of the payload, and the
+payload records checksums of every source it was built from and the
+transliteration used to fold titles (see gather.text); read_snapshot
+returns None whenever any of these do not match, and callers fall back to
+the sources.
+
+Sections are unpickled when read, so only read snapshots you built.
+
+Build one with:
+
+    python -m gather.snapshot
+"""
+
+import hashlib
+import os
+import pickle
+import struct
+import time
+
+from .instrument import record_load
+from .text import TRANSLITERATION
+# get_snapshot lives in the loader, so that looking for a snapshot does not
+# import this module unless there is one
+from .loader import (CATALOG_FILES, DATA_DIR, SNAPSHOT_FILE, get_snapshot,
+                     load_catalog, load_timings)
+
+MAGIC = b'GATHERSNAP'
+# Bump whenever the payload layout changes
+SNAPSHOT_VERSION = 1
+
+# Magic string, format version, SHA-256 of the payload
+_HEADER = struct.Struct('>10sI32s')
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Package modules whose code shapes the snapshot contents
+_PACKAGE_SOURCES = ('hymns_data.py', 'data.py', 'index.py', 'text.py',
+                    'loader.py', 'records.py')
+
+
+def _source_paths(data_dir):
+    """Get the path of every file a snapshot is built from."""
+    paths = {name: os.path.join(_PACKAGE_DIR, name)
+             for name in _PACKAGE_SOURCES}
+    paths.update((file_name, os.path.join(data_dir, file_name))
+                 for file_name in CATALOG_FILES.values())
+    return paths
+
+
+def _sources(data_dir):
+    """Get what a snapshot built now would be built from.
+
+    These are the checksums of the source files, and the transliteration
+    fold() uses, which shapes the folded indexes.
+    """
+    sources = _checksums(data_dir)
+    sources['transliteration'] = TRANSLITERATION
+    return sources
+
+
+def _checksums(data_dir):
+    """Get the SHA-256 checksum of every source file, or None if missing."""
+    checksums = {}
+    for name, path in _source_paths(data_dir).items():
+        try:
+            with open(path, 'rb') as f:
+                checksums[name] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            checksums[name] = None
+    return checksums
+
+
+class Snapshot:
+    """Sections of a snapshot file, unpickled on first access.
+
+    Sections are "hymns", "index:<name>" for each entry of
+    gather.data.INDEX_BUILDERS and "catalog:<name>" for each entry of
+    gather.loader.CATALOG_FILES.
+    """
+
+    def __init__(self, sections):
+        self._sections = sections
+        self._loaded = {}
+
+    def __contains__(self, name):
+        return name in self._sections
+
+    def get(self, name, default=None):
+        """Get a section by name, or default if it is not in the snapshot."""
+        if name not in self._loaded:
+            if name not in self._sections:
+                return default
+            self._loaded[name] = pickle.loads(self._sections[name])
+        return self._loaded[name]
+
+
+def build_snapshot(path=None, data_dir=None):
+    """Compile the catalogs, hymns table and indexes into a snapshot file.
+
+    Args:
+        path: Snapshot file to write; defaults to SNAPSHOT_FILE in data_dir
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+
+    Returns:
+        str: Path of the snapshot file
+    """
+    from .data import INDEX_BUILDERS
+    from .hymns_data import hymns
+    data_dir = data_dir or DATA_DIR
+    path = path or os.path.join(data_dir, SNAPSHOT_FILE)
+    sections = {'hymns': hymns}
+    for name, build in INDEX_BUILDERS.items():
+        sections['index:' + name] = build(hymns)
+    for name, file_name in CATALOG_FILES.items():
+        sections['catalog:' + name] = load_catalog(
+            os.path.join(data_dir, file_name))
+    payload = {
+        'sources': _sources(data_dir),
+        'sections': {name: pickle.dumps(section, pickle.HIGHEST_PROTOCOL)
+                     for name, section in sections.items()},
+    }
+    body = pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+    header = _HEADER.pack(MAGIC, SNAPSHOT_VERSION,
+                          hashlib.sha256(body).digest())
+    # Write to a temporary file first so readers never see a partial file
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(temp_path, path)
+    return path
+
+
+def read_snapshot(path=None, data_dir=None):
+    """Read a snapshot file.
+
+    Args:
+        path: Snapshot file to read; defaults to SNAPSHOT_FILE in data_dir
+        data_dir: Directory holding the catalog files; defaults to DATA_DIR
+
+    Returns:
+        Snapshot: Snapshot sections, or None if the file is missing,
+            corrupt, from another format version, or older than its
+            sources
+    """
+    start = time.perf_counter()
+    data_dir = data_dir or DATA_DIR
+    path = path or os.path.join(data_dir, SNAPSHOT_FILE)
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+    if len(blob) < _HEADER.size:
+        return None
+    magic, version, digest = _HEADER.unpack_from(blob)
+    body = memoryview(blob)[_HEADER.size:]
+    if (magic != MAGIC or version != SNAPSHOT_VERSION
+            or hashlib.sha256(body).digest() != digest):
+        return None
+    try:
+        payload = pickle.loads(body)
+    except Exception:
+        # Written by an incompatible Python version
+        return None
+    if payload['sources'] != _sources(data_dir):
+        return None
+    record_load('snapshot', time.perf_counter() - start)
+    return Snapshot(payload['sections'])
+
+
+if __name__ == '__main__':
+    path = build_snapshot()
+    for file_name, (loader_name, seconds) in load_timings.items():
+        print(f"Parsed {file_name} in {seconds * 1000:.1f} ms ({loader_name})")
+    print(f"✓ Saved to {path}")
@@ -0,0 +1,121 @@
+"""Title normalization helpers"""
+
+import re
+import unicodedata
+
+# Transliteration behind keyify and fold, recorded in catalog snapshots
+# since folded indexes built with one do not match queries folded with the
+# other. Unidecode is a dependency (see setup.py); the fallback covers
+# copies of the package run without installing it.
+try:
+    from unidecode import unidecode
+    TRANSLITERATION = 'unidecode'
+except ImportError:
+    TRANSLITERATION = 'nfkd'
+
+    # Letters without a decomposition, spelled as Unidecode spells them
+    _LETTERS = str.maketrans({
+        'ß': 'ss', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ø': 'o',
+        'Ø': 'O', 'đ': 'd', 'Đ': 'D', 'ð': 'd', 'Ð': 'D', 'þ': 'th',
+        'Þ': 'Th', 'ł': 'l', 'Ł': 'L', 'ı': 'i', 'ħ': 'h', 'Ħ': 'H',
+    })
+
+    def unidecode(string):
+        """Strip accents by decomposing characters and dropping the marks."""
+        decomposed = unicodedata.normalize('NFKD', string.translate(_LETTERS))
+        return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+# Apostrophes are dropped so "Lamb's" folds to "lambs", not "lamb s"
+_APOSTROPHES = re.compile(r"['’]")
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+# ASCII translation table for keys: letters lower-cased, apostrophes, colons
+# and periods dropped ("Lamb's" -> "lambs", "3:57" -> "357"), and all other
+# punctuation turned into word breaks
+_KEY_TABLE = {}
+for _code in range(128):
+    _char = chr(_code)
+    if _char.isalnum():
+        _KEY_TABLE[_code] = _char.lower()
+    else:
+        _KEY_TABLE[_code] = ' '
+for _char in "'’:.":
+    _KEY_TABLE[ord(_char)] = None
+del _code, _char
+
+
+def keyify(string: str):
+    """Convert human-readable titlecase to lowercase hyphen-separated string.
+
+    Notes after a "|" are removed and accented letters are transliterated,
+    so "Glória, Glória | Taizé" becomes "gloria-gloria".
+    """
+    # Remove notes, if any
+    if "|" in string:
+        string = string.split("|")[0]
+    if not string.isascii():
+        string = unidecode(string)
+        if not string.isascii():
+            string = ''.join(c if c.isascii() else ' ' for c in string)
+    return '-'.join(string.translate(_KEY_TABLE).split())
+
+
+def keyify_many(strings):
+    """Convert many titles to keys at once, as keyify does.
+
+    Repeated titles are converted once.
+
+    Returns:
+        list: Key for each title, in input order
+    """
+    keys = {}
+    result = []
+    append = result.append
+    for string in strings:
+        key = keys.get(string)
+        if key is None:
+            key = keys[string] = keyify(string)
+        append(key)
+    return result
+
+
+def fold(string):
+    """Fold a title for accent-, case- and punctuation-insensitive matching.
+
+    Transliterates to ASCII, lower-cases, drops apostrophes and collapses
+    every other run of punctuation or whitespace into a single space, so
+    "Ave María (Chant)" and "ave maria chant" fold to the same string.
+    """
+    string = _APOSTROPHES.sub('', unidecode(string).lower())
+    return _NON_ALNUM.sub(' ', string).strip()
+
+
+_SOUNDEX_CODES = {letter: code
+                  for letters, code in (('bfpv', '1'), ('cgjkqsxz', '2'),
+                                        ('dt', '3'), ('l', '4'), ('mn', '5'),
+                                        ('r', '6'))
+                  for letter in letters}
+
+
+def soundex(word):
+    """Get the American Soundex code of a folded word.
+
+    Words that sound alike share a code, so "shepard" and "shepherd" are
+    both S163 and "amazin" and "amazing" are both A525. Words that do not
+    start with a letter, such as psalm numbers, are returned unchanged.
+    """
+    if not word or not word[0].isalpha():
+        return word
+    code = word[0].upper()
+    last = _SOUNDEX_CODES.get(word[0])
+    for letter in word[1:]:
+        digit = _SOUNDEX_CODES.get(letter)
+        if digit is not None and digit != last:
+            code += digit
+            if len(code) == 4:
+                return code
+        # H and W do not separate letters with the same code; vowels do
+        if letter not in 'hw':
+            last = digit
+    return code.ljust(4, '0')
@@ -0,0 +1,252 @@
+# =============================================================================
+# generate_synthetic_catalog.py
+#
+# This script generates synthetic hymnals, much larger than the ~900 real
+# titles, for testing the gather package at scale. Each synthetic hymnal is
+# written both as a YAML catalog in the gather.yml schema and as a Python
+# module holding a `hymns` title -> number dictionary, like
+# gather/hymns_data.py.
+#
+# Titles are drawn from the real Gather index: the number of words follows the
+# real distribution, words follow each other as they do in real titles (so
+# accented words such as "Glória" appear about as often), and the same share
+# of titles end in a parenthetical such as "(Haugen)". Numbers are shared
+# between titles, and URLs are present, as often as in the real data. Output
+# is reproducible for a given seed.
+#
+#     python generate_synthetic_catalog.py --size 10k --size 100k --size 1m
+#
+# =============================================================================
+"""
+Generate synthetic hymnals in the gather.yml and hymns table formats.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import os
+import random
+import re
+import string
+import sys
+
+# Generate from the package in this checkout, not an installed copy
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+import gather
+from gather.loader import CATALOG_FILES, DATA_DIR, load_catalog
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+_PARENTHETICAL = re.compile(r'^(.*?) \(([^)]*)\)$')
+
+# Plain scalars YAML reads as booleans or null rather than strings
+_YAML_WORDS = {'y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null'}
+
+
+class Weighted:
+    """Sampler of values in proportion to how often they were seen."""
+
+    def __init__(self, values):
+        counts = {}
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+        self.values = list(counts)
+        self.cumulative = list(itertools.accumulate(counts.values()))
+
+    def sample(self, rng):
+        """Draw one value."""
+        point = rng.random() * self.cumulative[-1]
+        return self.values[bisect.bisect_right(self.cumulative, point)]
+
+
+class TitleModel:
+    """Distributions of the real hymn titles that synthetic titles follow.
+
+    Args:
+        titles: Real titles
+        url_share: Share of real catalog entries with a URL
+    """
+
+    def __init__(self, titles, url_share):
+        self.titles = list(titles)
+        self.url_share = url_share
+        bodies, parentheticals = [], []
+        for title in self.titles:
+            match = _PARENTHETICAL.match(title)
+            if match:
+                bodies.append(match.group(1))
+                parentheticals.append(match.group(2))
+            else:
+                bodies.append(title)
+        self.parenthetical_share = len(parentheticals) / len(self.titles)
+        self.parentheticals = Weighted(parentheticals)
+        words = [body.split() for body in bodies]
+        self.lengths = Weighted(len(w) for w in words if w)
+        self.first_words = Weighted(w[0] for w in words if w)
+        self.all_words = Weighted(word for w in words for word in w)
+        followers = {}
+        for w in words:
+            for a, b in zip(w, w[1:]):
+                followers.setdefault(a, []).append(b)
+        self.next_words = {a: Weighted(b) for a, b in followers.items()}
+
+    @classmethod
+    def from_gather(cls):
+        """Get the model of the real Gather index and gather.yml."""
+        entries = load_catalog(os.path.join(DATA_DIR, CATALOG_FILES['gather']))
+        url_share = sum(hymn.has_url for hymn in entries.values()) / len(entries)
+        return cls(gather.hymns, url_share)
+
+    def title(self, rng):
+        """Draw one title."""
+        words = [self.first_words.sample(rng)]
+        for _ in range(self.lengths.sample(rng) - 1):
+            following = self.next_words.get(words[-1])
+            # Mostly continue as real titles do, sometimes jump anywhere
+            sampler = (following if following is not None and rng.random() < 0.8
+                       else self.all_words)
+            words.append(sampler.sample(rng))
+        title = ' '.join(words)
+        if rng.random() < self.parenthetical_share:
+            title += f' ({self.parentheticals.sample(rng)})'
+        return title
+
+    def stats(self, titles):
+        """Summarize title lengths, accents and parentheticals."""
+        titles = list(titles)
+        return {
+            'titles': len(titles),
+            'mean_words': sum(len(t.split()) for t in titles) / len(titles),
+            'accented': sum(not t.isascii() for t in titles) / len(titles),
+            'parenthetical': sum(t.endswith(')') for t in titles) / len(titles),
+        }
+
+
+def generate_hymns(size, seed=0, model=None):
+    """Generate a synthetic hymns table.
+
+    Args:
+        size: Number of titles
+        seed: Random seed; the same seed gives the same table
+        model: TitleModel to follow; defaults to TitleModel.from_gather()
+
+    Returns:
+        dict: Title -> number, in alphabetical order like gather.hymns
+    """
+    model = model or TitleModel.from_gather()
+    rng = random.Random(seed)
+    titles = set()
+    collisions = 0
+    while len(titles) < size:
+        title = model.title(rng)
+        if title in titles:
+            # Titles are distinct; once short titles are used up, lengthen
+            # repeats rather than keep drawing them
+            collisions += 1
+            if collisions < 20:
+                continue
+            while title in titles:
+                title += ' ' + model.all_words.sample(rng)
+        collisions = 0
+        titles.add(title)
+    titles = sorted(titles, key=str.lower)
+    # As in the real index, several titles share some numbers
+    real = gather.hymns
+    count = max(1, round(size * len(set(real.values())) / len(real)))
+    numbers = list(range(1, count + 1))
+    numbers += [rng.randint(1, count) for _ in range(size - count)]
+    rng.shuffle(numbers)
+    return dict(zip(titles, numbers))
+
+
+def catalog_entries(hymns, seed=0, url_share=0.5):
+    """Get gather.yml entries for a hymns table.
+
+    Returns:
+        dict: Key -> entry with number, original_title and url fields
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + '-_'
+    entries = {}
+    for title, number in hymns.items():
+        key = base = gather.keyify(title) or 'untitled'
+        suffix = 2
+        while key in entries:
+            key = f'{base}-{suffix}'
+            suffix += 1
+        url = None
+        if rng.random() < url_share:
+            url = ('https://www.youtube.com/watch?v='
+                   + ''.join(rng.choice(alphabet) for _ in range(11)))
+        entries[key] = {'number': number, 'original_title': title, 'url': url}
+    return entries
+
+
+def write_catalog(entries, path):
+    """Write entries as a YAML catalog in gather.yml form.
+
+    Entries are sorted by key and grouped under "# A"-style headings by
+    first letter, as in gather.yml. Titles, and keys YAML would read as
+    something other than a string, are written as JSON strings, which are
+    valid YAML double-quoted scalars, so no YAML library is needed.
+    """
+    heading = None
+    with open(path, 'w', encoding='utf-8') as f:
+        for key, entry in sorted(entries.items()):
+            letter = key[:1].upper()
+            if letter != heading:
+                heading = letter
+                f.write(f'# {letter}\n\n')
+            url = entry['url']
+            if not key[:1].isalpha() or key in _YAML_WORDS:
+                key = json.dumps(key)
+            f.write(f"{key}:\n"
+                    f"    number: {entry['number']}\n"
+                    f"    original_title: {json.dumps(entry['original_title'], ensure_ascii=False)}\n"
+                    f"    url: {url if url is not None else 'null'}\n")
+
+
+def write_hymns(hymns, path):
+    """Write a hymns table as a Python module, like gather/hymns_data.py."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('"""Hymnal Index - Synthetic"""\n\nhymns = {\n')
+        for title, number in hymns.items():
+            f.write(f'    {title!r}: {number},\n')
+        f.write('}\n')
+
+
+def parse_size(value):
+    """Parse a size such as "100k", "1m" or "2500"."""
+    value = value.lower()
+    if value in SIZES:
+        return SIZES[value]
+    if value[-1:] in ('k', 'm'):
+        return int(float(value[:-1]) * (1000 if value[-1] == 'k' else 1_000_000))
+    return int(value)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--size', action='append', metavar='N',
+                        help='number of titles, e.g. 10k, 100k, 1m or 2500; '
+                             'may be repeated (default 10k, 100k and 1m)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output-dir', default=os.path.join(REPO_DIR, 'synthetic'))
+    args = parser.parse_args()
+
+    model = TitleModel.from_gather()
+    os.makedirs(args.output_dir, exist_ok=True)
+    print(f"Real titles: {model.stats(model.titles)}")
+    for size_name in args.size or list(SIZES):
+        size = parse_size(size_name)
+        hymns = generate_hymns(size, args.seed, model)
+        entries = catalog_entries(hymns, args.seed, model.url_share)
+        name = size_name.lower()
+        yaml_path = os.path.join(args.output_dir, f'synthetic-{name}.yml')
+        hymns_path = os.path.join(args.output_dir, f'synthetic_hymns_{name}.py')
+        write_catalog(entries, yaml_path)
+        write_hymns(hymns, hymns_path)
+        print(f"✓ {size:,} titles: {model.stats(hymns)}")
+        print(f"  Saved to {yaml_path} and {hymns_path}")
@@ -1,11 +1,32 @@
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+# The YAML catalogs live at the top of the repository; installed copies of
+# the package carry them inside the package directory (see gather.loader)
+HERE = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILES = ('gather.yml', 'mass-settings.yml')
+
+
+class BuildWithCatalogs(build_py):
+    """Copy the YAML catalogs into the built gather package."""
+
+    def run(self):
+        super().run()
+        for file_name in CATALOG_FILES:
+            self.copy_file(os.path.join(HERE, file_name),
+                           os.path.join(self.build_lib, 'gather', file_name))
+
 
 setup(
     name='hymn-lists',
     version='0.1.0',
     packages=find_packages(),
+    install_requires=['PyYAML', 'Unidecode'],
+    cmdclass={'build_py': BuildWithCatalogs},
     description='Hymnal index data',
     author='mdgrossi',
     url='https://github.com/musicministry/song-urls',
-    python_requires='>=3.7',
-)
\ No newline at end of file
+    python_requires='>=3.8',
+)
@@ -0,0 +1,34 @@
+"""Shared fixtures for the gather tests"""
+
+import os
+import shutil
+
+import pytest
+
+from gather import catalog, data, loader, mass
+from gather.loader import CATALOG_FILES, DATA_DIR
+
+
+@pytest.fixture
+def fresh_caches(monkeypatch):
+    """Start from empty module-level caches, restored after the test."""
+    monkeypatch.setattr(loader, '_loaded', {})
+    monkeypatch.setattr(loader, '_signatures', {})
+    monkeypatch.setattr(loader, '_snapshots', {})
+    monkeypatch.setattr(catalog, '_gather_index', None)
+    monkeypatch.setattr(mass, '_mass_index', None)
+    monkeypatch.setattr(data, '_hymns', None)
+    monkeypatch.setattr(data, '_snapshot', None)
+    monkeypatch.setattr(data, '_snapshot_read', False)
+    monkeypatch.setattr(data, '_indexes', {})
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch, fresh_caches):
+    """Copy the YAML catalogs into a temporary data directory and use it."""
+    for file_name in CATALOG_FILES.values():
+        shutil.copy(os.path.join(DATA_DIR, file_name), tmp_path / file_name)
+    path = str(tmp_path)
+    monkeypatch.setattr(loader, 'DATA_DIR', path)
+    monkeypatch.setattr(mass, 'DATA_DIR', path)
+    return path
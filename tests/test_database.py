@@ -0,0 +1,78 @@
+"""Tests that gather.database answers as the in-memory lookups do"""
+
+import random
+
+import pytest
+
+import gather
+from gather import data
+from gather.database import Database, export_database
+
+# Terms covering trigram and scan paths, accents, case and punctuation
+SEARCH_TERMS = ['grace', 'GRACE', 'a', 'zz', 'é', 'gl', 'Glória', 'ave maria',
+                'ave-maria', "lamb's", "'s", '-', '!', 'a b', 'Dei',
+                'Ave María (Chant)', 'psalm 23', '23', 'e,', '', 'not a title']
+
+
+@pytest.fixture(scope='module')
+def database(tmp_path_factory):
+    """Export the catalogs into a temporary database."""
+    db = Database(export_database(
+        str(tmp_path_factory.mktemp('database') / 'catalog.sqlite')))
+    yield db
+    db.close()
+
+
+def sample_substrings(count=200, seed=0):
+    """Get random substrings of the hymn titles."""
+    rng = random.Random(seed)
+    titles = list(data.hymns)
+    terms = []
+    for _ in range(count):
+        title = rng.choice(titles)
+        start = rng.randrange(len(title))
+        terms.append(title[start:start + rng.randint(1, 8)])
+    return terms
+
+
+def test_hymn_numbers(database):
+    titles = list(data.hymns) + [title.lower() for title in data.hymns]
+    titles += ['Ave Maria (chant)', 'not a title', '', None, 645]
+    for title in titles:
+        assert database.get_hymn_number(title) == gather.get_hymn_number(title)
+    assert database.get_hymn_numbers(titles) == gather.get_hymn_numbers(titles)
+
+
+@pytest.mark.parametrize('term', SEARCH_TERMS + sample_substrings())
+def test_search(database, term):
+    assert database.search_hymns(term) == gather.search_hymns(term)
+
+
+def test_search_many(database):
+    terms = SEARCH_TERMS + SEARCH_TERMS[:3]
+    assert (database.search_hymns_many(terms)
+            == gather.search_hymns_many(terms))
+
+
+def test_numbers(database):
+    for number in sorted(set(data.hymns.values()))[::7] + [0, 99999]:
+        assert database.get_titles(number) == gather.get_titles(number)
+        assert database.get_entry(number) == gather.get_entry(number)
+    assert (database.get_hymns_in_range(20, 99)
+            == gather.get_hymns_in_range(20, 99))
+
+
+@pytest.mark.parametrize('title_or_key', [
+    'a-hymn-of-glory-let-us-sing', 'A Hymn of Glory Let Us Sing!',
+    'amazing grace', 'Glória, Glória', 'not a title', None])
+def test_urls(database, title_or_key):
+    assert database.get_url(title_or_key) == gather.get_url(title_or_key)
+
+
+@pytest.mark.parametrize('title_or_key', [
+    'cantus-missae-a-holy', 'cantus-missae-a-sanctus',
+    'Mass of Christ the Savior: Gloria', 'mass of christ the savior gloria',
+    'not a part'])
+def test_mass_parts(database, title_or_key):
+    assert (database.get_mass_part(title_or_key)
+            == gather.get_mass_part(title_or_key))
@@ -0,0 +1,53 @@
+"""Tests for swapping in edited catalogs with gather.reload"""
+
+import os
+
+from gather import catalog
+from gather.loader import load_catalogs
+from gather.reload import Reloader
+
+NEW_URL = 'https://example.com/amazing-grace-rehearsal'
+
+
+def edit_url(data_dir, old_url, new_url):
+    """Replace a URL in gather.yml."""
+    path = os.path.join(data_dir, 'gather.yml')
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text.replace(old_url, new_url))
+
+
+def test_swap(data_dir):
+    old_url = catalog.get_url('amazing-grace')
+    old_index = catalog._gather_index
+    # Edited before the Reloader exists, but after the catalog was loaded
+    edit_url(data_dir, old_url, NEW_URL)
+    reloaded = []
+    reloader = Reloader(data_dir=data_dir, on_reload=reloaded.append)
+    assert reloader.check() == ['gather']
+    assert reloaded == ['gather']
+    assert catalog._gather_index is not old_index
+    assert catalog.get_url('amazing-grace') == NEW_URL
+    assert load_catalogs()['gather']['amazing-grace'].url == NEW_URL
+    assert reloader.check() == []
+
+
+def test_unloaded_catalogs_skipped(data_dir):
+    edit_url(data_dir, 'https://', 'http://')
+    assert Reloader(data_dir=data_dir).check() == []
+    assert catalog._gather_index is None
+
+
+def test_failed_load_keeps_index(data_dir):
+    old_url = catalog.get_url('amazing-grace')
+    with open(os.path.join(data_dir, 'gather.yml'), 'a') as f:
+        f.write('broken: [\n')
+    reloader = Reloader(data_dir=data_dir)
+    assert reloader.check() == []
+    assert reloader.last_error is not None
+    assert catalog.get_url('amazing-grace') == old_url
+    # Not retried until the file changes again
+    reloader.last_error = None
+    assert reloader.check() == []
+    assert reloader.last_error is None
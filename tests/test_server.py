@@ -0,0 +1,94 @@
+"""Tests for request parsing and caching in gather.server"""
+
+import asyncio
+
+import pytest
+
+from gather.server import LookupServer, _etag_matches
+
+
+@pytest.fixture
+def server():
+    """Lookup server with a fixed catalog fingerprint."""
+    return LookupServer(version='test')
+
+
+def test_lookup(server):
+    status, headers, body = server.respond(
+        'GET', '/lookup?title=Amazing%20Grace', {})
+    assert status == 200
+    assert body == b'{"title": "Amazing Grace", "number": 645}'
+    assert headers['ETag'] == server.etag('/lookup?title=Amazing%20Grace')
+
+
+@pytest.mark.parametrize('method, target, status', [
+    ('GET', '/nowhere', 404),
+    ('POST', '/lookup?title=Amazing%20Grace', 405),
+    ('GET', '/lookup', 400),
+    ('GET', '/entry?number=abc', 400),
+])
+def test_errors(server, method, target, status):
+    assert server.respond(method, target, {})[0] == status
+
+
+def test_missing_parameter_wins_over_etag(server):
+    assert server.respond('GET', '/lookup', {'if-none-match': '*'})[0] == 400
+
+
+def test_blank_parameter(server):
+    status, _, body = server.respond('GET', '/search?q=', {})
+    assert status == 200
+    assert len(body) > 2
+
+
+@pytest.mark.parametrize('if_none_match, matches', [
+    ('{etag}', True),
+    ('W/{etag}', True),
+    ('*', True),
+    ('"other", {etag}', True),
+    ('"other",{etag}', True),
+    ('"other"', False),
+    ('', False),
+])
+def test_etag_matches(server, if_none_match, matches):
+    etag = server.etag('/search?q=grace')
+    assert _etag_matches(etag, if_none_match.format(etag=etag)) is matches
+    status = server.respond('GET', '/search?q=grace', {
+        'if-none-match': if_none_match.format(etag=etag)})[0]
+    assert status == (304 if matches else 200)
+
+
+def exchange(server, request):
+    """Send raw request bytes to a served connection and read until closed."""
+    async def run():
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(request)
+            await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return response
+    return asyncio.run(run())
+
+
+def test_keep_alive(server):
+    request = b'GET /lookup?title=Amazing%20Grace HTTP/1.1\r\n\r\n'
+    response = exchange(server, request + request.replace(
+        b'\r\n\r\n', b'\r\nConnection: close\r\n\r\n'))
+    assert response.count(b'HTTP/1.1 200 OK') == 2
+
+
+@pytest.mark.parametrize('request_bytes', [
+    b'GET /lookup?title=x HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+    b'GET /lookup?title=x HTTP/1.1\r\nContent-Length: -5\r\n\r\n',
+    b'GET /lookup?title=x HTTP/1.1\r\nContent-Length: 10\r\n\r\nshort',
+    b'garbage\r\n\r\n',
+])
+def test_bad_requests_answered(server, request_bytes):
+    response = exchange(server, request_bytes)
+    assert response.startswith(b'HTTP/1.1 400 Bad Request\r\n')
+    assert b'Connection: close' in response
@@ -0,0 +1,75 @@
+"""Tests for the fallback from stale or corrupt snapshots"""
+
+import os
+
+import pytest
+
+from gather import data, loader, snapshot
+from gather.hymns_data import hymns
+from gather.loader import get_snapshot, load_catalogs
+from gather.snapshot import build_snapshot, read_snapshot
+
+
+@pytest.fixture
+def snapshot_path(data_dir):
+    """Build a snapshot in the temporary data directory."""
+    return build_snapshot(data_dir=data_dir)
+
+
+def rewrite(path, change):
+    """Replace a file's bytes with change(bytes)."""
+    with open(path, 'rb') as f:
+        blob = f.read()
+    with open(path, 'wb') as f:
+        f.write(change(blob))
+
+
+def test_fresh(data_dir, snapshot_path):
+    sections = read_snapshot(data_dir=data_dir)
+    assert sections.get('hymns') == hymns
+    assert 'index:folded' in sections
+    catalog = sections.get('catalog:gather')
+    assert catalog['amazing-grace'].number == 645
+
+
+def test_read_once(data_dir, snapshot_path):
+    assert get_snapshot(data_dir) is get_snapshot(data_dir)
+    assert data._get_snapshot() is get_snapshot(data_dir)
+
+
+@pytest.mark.parametrize('change', [
+    lambda blob: blob[:-1] + bytes([blob[-1] ^ 1]),
+    lambda blob: blob[:20],
+    lambda blob: b'NOTASNAP!!' + blob[10:],
+    lambda blob: b'',
+], ids=['flipped', 'truncated', 'magic', 'empty'])
+def test_corrupt(data_dir, snapshot_path, change):
+    rewrite(snapshot_path, change)
+    assert read_snapshot(data_dir=data_dir) is None
+
+
+def test_missing(data_dir):
+    assert read_snapshot(data_dir=data_dir) is None
+    assert get_snapshot(data_dir) is None
+
+
+def test_stale_source(data_dir, snapshot_path):
+    path = os.path.join(data_dir, 'gather.yml')
+    rewrite(path, lambda blob: blob.replace(
+        b'original_title: Amazing Grace\n',
+        b'original_title: Amazing Grace!\n', 1))
+    assert read_snapshot(data_dir=data_dir) is None
+    # Callers fall back to parsing the edited YAML
+    catalog = load_catalogs(data_dir, names=['gather'])['gather']
+    assert catalog['amazing-grace'].title == 'Amazing Grace!'
+
+
+def test_other_transliteration(data_dir, snapshot_path, monkeypatch):
+    monkeypatch.setattr(snapshot, 'TRANSLITERATION', 'other')
+    assert read_snapshot(data_dir=data_dir) is None
+
+
+def test_lookups_from_snapshot(data_dir, snapshot_path):
+    assert data.get_hymn_number('ave maria chant') == 887
+    assert 'Amazing Grace' in data.search_hymns('grace')
+    assert loader._snapshots[data_dir] is not None